@@ -1,109 +1,3 @@
-from generated_models.ae_xsd_schema import (
-    AeAnalyseSimtime,
-    AeAnalysisType,
-    AeAxiBusType,
-    AeChipletType,
-    AeCpuArchType,
-    AeCpuCluster,
-    AeCpuCore,
-    AeCpuFrequency,
-    AeD2DconfigType,
-    AeDataReceivedEventType,
-    AeDualCoreCluster,
-    AeDualCoreClusterCoresPerCluster,
-    AeEndpointDmaconfigType,
-    AeEthernetInterfaceType,
-    AeEthernetInterfaceTypeMode,
-    AeGenericHardwareType,
-    AeGenericHwdataReceivedEventType,
-    AeGenericHwfrequency,
-    AeGenericHwtimingEventType,
-    AeGenericHwtriggerEventType,
-    AeHexaCoreCluster,
-    AeHexaCoreClusterCoresPerCluster,
-    AeHwSwMappingType,
-    AeIdentity,
-    AeInterfaceData,
-    AeInterfaceType,
-    AeNetworkTopologyType,
-    AeOctaCoreCluster,
-    AeOctaCoreClusterCoresPerCluster,
-    AeOperationsSequenceType,
-    AeOperationType,
-    AeOsType,
-    AePowerParameterType,
-    AePreBuiltApplicationType,
-    AeQuadCoreCluster,
-    AeQuadCoreClusterCoresPerCluster,
-    AeReference,
-    AeSingleCoreCluster,
-    AeSingleCoreClusterCoresPerCluster,
-    AeSwcCustomBehaviorType,
-    AeSwcType,
-    AeTimeEventType,
-    AeUcieInterfaceType,
-    AeUcieInterfaceTypeMode,
-    ArPackage,
-    ChipletLinkLatencyUnit,
-    LatencyUnit,
-    LogicalIfDelayUnit,
-    PeriodUnit,
-    PhysicalIfDelayUnit,
-    ProtocolConvLatencyUnit,
-    SimulationTimeUnit,
-)
-
-__all__ = [
-    "ArPackage",
-    "AeAnalyseSimtime",
-    "AeAnalysisType",
-    "AeAxiBusType",
-    "AeChipletType",
-    "AeCpuArchType",
-    "AeCpuCluster",
-    "AeCpuCore",
-    "AeCpuFrequency",
-    "AeD2DconfigType",
-    "AeDataReceivedEventType",
-    "AeDualCoreCluster",
-    "AeDualCoreClusterCoresPerCluster",
-    "AeEndpointDmaconfigType",
-    "AeEthernetInterfaceType",
-    "AeEthernetInterfaceTypeMode",
-    "AeGenericHwdataReceivedEventType",
-    "AeGenericHwfrequency",
-    "AeGenericHwtimingEventType",
-    "AeGenericHwtriggerEventType",
-    "AeGenericHardwareType",
-    "AeHexaCoreCluster",
-    "AeHexaCoreClusterCoresPerCluster",
-    "AeHwSwMappingType",
-    "AeIdentity",
-    "AeInterfaceData",
-    "AeInterfaceType",
-    "AeNetworkTopologyType",
-    "AeOctaCoreCluster",
-    "AeOctaCoreClusterCoresPerCluster",
-    "AeOperationType",
-    "AeOperationsSequenceType",
-    "AeOsType",
-    "AePowerParameterType",
-    "AePreBuiltApplicationType",
-    "AeQuadCoreCluster",
-    "AeQuadCoreClusterCoresPerCluster",
-    "AeReference",
-    "AeSingleCoreCluster",
-    "AeSingleCoreClusterCoresPerCluster",
-    "AeSwcCustomBehaviorType",
-    "AeSwcType",
-    "AeTimeEventType",
-    "AeUcieInterfaceType",
-    "AeUcieInterfaceTypeMode",
-    "ChipletLinkLatencyUnit",
-    "LatencyUnit",
-    "LogicalIfDelayUnit",
-    "PeriodUnit",
-    "PhysicalIfDelayUnit",
-    "ProtocolConvLatencyUnit",
-    "SimulationTimeUnit",
-]
+# The AE models come from the shared generated_models package and, like
+# there, are only imported when one of them is first accessed.
+from generated_models import __all__, __dir__, __getattr__  # noqa: F401
@@ -0,0 +1,158 @@
+import contextlib
+import hashlib
+import heapq
+import json
+import os
+from pathlib import Path
+
+import numpy as np
+
+try:
+    import fcntl
+except ImportError:  # Windows: no cross-process locking
+    fcntl = None
+
+DEFAULT_CACHE_DIR = Path(os.environ.get("AE_EMBEDDING_CACHE")
+                         or Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+                         / "ae_xmlvalidator" / "embeddings")
+VECTORS_FILE = "vectors.npy"
+INDEX_FILE = "index.json"
+LOCK_FILE = "lock"
+
+
+class EmbeddingCache:
+    """
+    Persistent embeddings of one model, keyed by a hash of the text, shared
+    by every process using the same cache_dir (rag_indexer.py, the
+    retrievers of concurrent eval runs, ...).
+
+    Vectors live in a fixed-size float32 matrix memory-mapped from
+    <cache_dir>/<model>/vectors.npy, whose row count is derived from max_mb.
+    index.json maps each text hash to its row and a last-used tick. When the
+    matrix is full, the least recently used rows are reused.
+
+    Every read or write of the matrix happens under an exclusive flock on
+    <cache_dir>/<model>/lock, after reloading index.json, so a process never
+    returns or overwrites a row another process has since reassigned. The
+    encoder itself runs outside the lock. Hits only update the ticks in
+    memory; they are persisted with the next write.
+    """
+
+    def __init__(self, model_name: str, cache_dir=DEFAULT_CACHE_DIR, max_mb: float = 256):
+        self.model_name = model_name
+        self.path = Path(cache_dir) / model_name.replace("/", "__")
+        self.max_mb = max_mb
+        self.vectors = None
+        self.rows = {}  # text hash -> [row, last-used tick]
+        self.clock = 0
+        self.free = []
+        self.touched = {}  # text hash -> tick of hits not written to index.json yet
+
+    def key(self, text: str) -> str:
+        return hashlib.sha256(f"{self.model_name}\n{text}".encode("utf-8")).hexdigest()
+
+    @contextlib.contextmanager
+    def _locked(self):
+        """Hold the cache lock and see the latest index.json and matrix."""
+        self.path.mkdir(parents=True, exist_ok=True)
+        with open(self.path / LOCK_FILE, "a+b") as lock:
+            if fcntl is not None:
+                fcntl.flock(lock, fcntl.LOCK_EX)
+            try:
+                self._reload()
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(lock, fcntl.LOCK_UN)
+
+    def _reload(self):
+        self.vectors, self.rows, self.free = None, {}, []
+        try:
+            index = json.loads((self.path / INDEX_FILE).read_text(encoding="utf-8"))
+            vectors = np.load(self.path / VECTORS_FILE, mmap_mode="r+")
+        except (OSError, ValueError):
+            return  # no cache yet, or unreadable: start empty
+        if len(vectors) != index["capacity"] or vectors.shape[1] != index["dim"]:
+            return
+        self.vectors, self.rows = vectors, index["rows"]
+        self.clock = max(self.clock, index["clock"])
+        for key, tick in self.touched.items():
+            if key in self.rows:
+                self.rows[key][1] = max(self.rows[key][1], tick)
+        used = {row for row, _ in self.rows.values()}
+        self.free = [row for row in range(len(vectors) - 1, -1, -1) if row not in used]
+
+    def _allocate(self, dim: int):
+        capacity = max(1, int(self.max_mb * 2**20) // (dim * 4))
+        # A fresh file replaces the old one, so other processes' mappings stay valid.
+        tmp = self.path / (VECTORS_FILE + ".tmp")
+        vectors = np.lib.format.open_memmap(tmp, mode="w+", dtype=np.float32, shape=(capacity, dim))
+        vectors.flush()
+        tmp.replace(self.path / VECTORS_FILE)
+        self.vectors = vectors
+        self.rows, self.free = {}, list(range(capacity - 1, -1, -1))
+
+    def _take_rows(self, n: int) -> list:
+        if len(self.free) < n:
+            # Evict the least recently used entries.
+            candidates = ((tick, key) for key, (_, tick) in self.rows.items())
+            for _, key in heapq.nsmallest(n - len(self.free), candidates):
+                self.free.append(self.rows.pop(key)[0])
+        return [self.free.pop() for _ in range(min(n, len(self.free)))]
+
+    def encode(self, texts, encoder) -> np.ndarray:
+        """
+        Embeddings of texts as one float32 matrix, in order. encoder(list of
+        texts) -> array is only called for the texts not cached yet.
+        """
+        keys = [self.key(text) for text in texts]
+        found = {}
+        with self._locked():
+            self.clock += 1
+            for key in keys:
+                if key in self.rows and key not in found:
+                    self.rows[key][1] = self.touched[key] = self.clock
+                    found[key] = np.array(self.vectors[self.rows[key][0]])
+        missing = {}
+        for key, text in zip(keys, texts):
+            if key not in found:
+                missing.setdefault(key, text)
+
+        if missing:
+            embedded = np.asarray(encoder(list(missing.values())), dtype=np.float32)
+            found.update(zip(missing, embedded))
+            with self._locked():
+                if self.vectors is None:
+                    self._allocate(embedded.shape[1])
+                elif self.vectors.shape[1] != embedded.shape[1]:
+                    raise ValueError(f"{self.path} holds {self.vectors.shape[1]}-d embeddings, "
+                                     f"the encoder returned {embedded.shape[1]}-d ones")
+                self.clock += 1
+                new = [key for key in missing if key not in self.rows]  # not added meanwhile
+                for row, key in zip(self._take_rows(len(new)), new):
+                    self.vectors[row] = found[key]
+                    self.rows[key] = [row, self.clock]
+                self._save()
+
+        if not keys:
+            dim = 0 if self.vectors is None else self.vectors.shape[1]
+            return np.empty((0, dim), dtype=np.float32)
+        return np.stack([found[key] for key in keys])
+
+    def save(self):
+        """Persist the ticks of recent hits."""
+        if self.touched:
+            with self._locked():
+                self._save()
+
+    def _save(self):
+        # Called with the lock held.
+        if self.vectors is None:
+            return
+        self.vectors.flush()
+        index = {"capacity": len(self.vectors), "dim": self.vectors.shape[1],
+                 "clock": self.clock, "rows": self.rows}
+        tmp = self.path / (INDEX_FILE + ".tmp")
+        tmp.write_text(json.dumps(index), encoding="utf-8")
+        tmp.replace(self.path / INDEX_FILE)
+        self.touched = {}
@@ -0,0 +1,107 @@
+import json
+import math
+import re
+from pathlib import Path
+
+LEXICAL_FILE = "lexical.json"
+# Schema identifiers keep their inner dashes/underscores: CAN-FD, Endpoint_DMA_Configuration.
+IDENTIFIER = re.compile(r"[A-Za-z0-9]+(?:[-_][A-Za-z0-9]+)*")
+K1 = 1.5
+B = 0.75
+
+
+def identifiers(text: str) -> list[str]:
+    return IDENTIFIER.findall(text)
+
+
+def tokenize(text: str) -> list[str]:
+    """
+    Lower-cased identifiers plus their dash/underscore-separated parts, so
+    "UCIe" matches UCIe-INTERFACE and "CortexA72" matches CortexA72.
+    """
+    tokens = []
+    for identifier in identifiers(text.lower()):
+        tokens.append(identifier)
+        parts = re.split(r"[-_]", identifier)
+        if len(parts) > 1:
+            tokens += parts
+    return tokens
+
+
+class LexicalIndex:
+    """
+    BM25 inverted index over the schema chunks (element and type names, enum
+    values, documentation), built by rag_indexer.py next to the vector index.
+    Literal schema tokens that MiniLM embeds poorly are matched exactly, and
+    names maps every element/type name to its chunks for exact-name lookups.
+    """
+
+    def __init__(self, path="./vector_index"):
+        data = json.loads((Path(path) / LEXICAL_FILE).read_text(encoding="utf-8"))
+        self.documents = data["documents"]
+        self.lengths = data["lengths"]
+        self.postings = data["postings"]  # term -> [[chunk, term frequency], ...]
+        self.names = data["names"]  # lower-cased name -> [chunk, ...]
+        self.average_length = sum(self.lengths) / max(len(self.lengths), 1)
+        n = len(self.documents)
+        self.idf = {term: math.log(1 + (n - len(hits) + 0.5) / (len(hits) + 0.5))
+                    for term, hits in self.postings.items()}
+
+    @staticmethod
+    def save(path, documents, metadatas):
+        """Tokenize the chunks and write the index; names come from metadata["name"]."""
+        documents = list(documents)
+        postings, names, lengths = {}, {}, []
+        for i, (text, metadata) in enumerate(zip(documents, metadatas)):
+            tokens = tokenize(text)
+            lengths.append(len(tokens))
+            counts = {}
+            for token in tokens:
+                counts[token] = counts.get(token, 0) + 1
+            for token, count in counts.items():
+                postings.setdefault(token, []).append([i, count])
+            if metadata.get("name"):
+                names.setdefault(metadata["name"].lower(), []).append(i)
+        path = Path(path)
+        path.mkdir(parents=True, exist_ok=True)
+        data = {"documents": documents, "lengths": lengths, "postings": postings, "names": names}
+        (path / LEXICAL_FILE).write_text(json.dumps(data), encoding="utf-8")
+
+    def scores(self, query: str) -> dict:
+        """BM25 score of every chunk sharing at least one token with the query."""
+        scores = {}
+        for term in set(tokenize(query)):
+            idf = self.idf.get(term)
+            if idf is None:
+                continue
+            for i, tf in self.postings[term]:
+                norm = K1 * (1 - B + B * self.lengths[i] / self.average_length)
+                scores[i] = scores.get(i, 0.0) + idf * tf * (K1 + 1) / (tf + norm)
+        return scores
+
+    def search(self, query: str, top_k: int = 5) -> list[str]:
+        """Documents of the top_k chunks by BM25 score, best first."""
+        scores = self.scores(query)
+        return [self.documents[i] for i in sorted(scores, key=scores.get, reverse=True)[:top_k]]
+
+    def exact(self, query: str, top_k: int = 5) -> list[str] | None:
+        """
+        Chunks for a query made only of schema names (e.g. "CortexA72" or
+        "AeChipletType, UCIe-INTERFACE"), best BM25 match first; None if any
+        word of the query is not a name.
+        """
+        words = [word.lower() for word in identifiers(query)]
+        if not words or any(word not in self.names for word in words):
+            return None
+        scores = self.scores(query)
+        hits = {i for word in words for i in self.names[word]}
+        return [self.documents[i] for i in sorted(hits, key=lambda i: -scores.get(i, 0.0))[:top_k]]
+
+
+def fuse(*rankings, k: int = 60) -> list[str]:
+    """Reciprocal rank fusion of ranked document lists, best first."""
+    scores = {}
+    for ranking in rankings:
+        for rank, document in enumerate(ranking):
+            scores[document] = scores.get(document, 0.0) + 1 / (k + rank + 1)
+    return sorted(scores, key=scores.get, reverse=True)
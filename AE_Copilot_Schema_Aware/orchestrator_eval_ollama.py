@@ -2,12 +2,16 @@ import json
 import subprocess
 import argparse
 import time
-import inspect
-from pydantic import BaseModel, ValidationError
+import sys
+from pathlib import Path
+from pydantic import ValidationError
 from rag_retriever import RagRetriever
-import ae_xsd_schema
 import tools
 
+# The generated models and their dispatch index live at the repo root.
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from src.model_dispatch import key_index, validate_data
+
 # -------------------- Helper --------------------
 def enum_safe(obj):
     """Handle Enums and complex types during JSON serialization."""
@@ -83,21 +87,20 @@ User query:
 """
 
 # -------------------- MODEL VALIDATION --------------------
-def select_candidate_models(schema_context: str):
-    """Select Pydantic models most relevant to the RAG schema context."""
-    all_models = [
-        cls for _, cls in inspect.getmembers(ae_xsd_schema, inspect.isclass)
-        if issubclass(cls, BaseModel) and cls.__module__ == ae_xsd_schema.__name__
-    ]
-    candidates = [m for m in all_models if m.__name__.lower() in schema_context.lower()]
-    return candidates or all_models
+def select_candidate_models(parsed: dict, schema_context: str):
+    """
+    Pydantic models that fit the parsed JSON, best first, from the one-time
+    key index: ranked by top-level key overlap, with models named in the RAG
+    schema context winning ties.
+    """
+    index = key_index()
+    return index.rank(parsed, prefer=index.named_in(schema_context))
 
 def validate_and_print(parsed: dict, schema_context: str):
     """Validate parsed JSON against schema and print clean output."""
-    candidates = select_candidate_models(schema_context)
-    for model in candidates:
+    for model in select_candidate_models(parsed, schema_context):
         try:
-            obj = model(**parsed)
+            obj = validate_data(parsed, model)
             print(f"Validated → {model.__name__}")
             print(json.dumps(obj.model_dump(), indent=2, default=enum_safe))
             return True
@@ -111,9 +114,11 @@ def validate_and_print(parsed: dict, schema_context: str):
 def main():
     parser = argparse.ArgumentParser()
     parser.add_argument("--model", required=True, help="Ollama model to use")
+    parser.add_argument("--retriever", choices=["chroma", "numpy"], default="chroma",
+                        help="vector index backend (numpy: in-process memory-mapped index)")
     args = parser.parse_args()
 
-    retriever = RagRetriever()
+    retriever = RagRetriever(backend=args.retriever)
 
     scenarios = {
         "S1_cluster": "Create a CPU cluster named C1 with frequency 2000000 Hz and 4 cores per cluster.",
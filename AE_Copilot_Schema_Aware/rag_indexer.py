@@ -1,12 +1,21 @@
+import argparse
+import hashlib
 import json
 from pathlib import Path
 from sentence_transformers import SentenceTransformer
 import chromadb
 from tqdm import tqdm
+from embedding_cache import EmbeddingCache
+from lexical_index import LexicalIndex
+from schema_chunker import structured_chunks
+from vector_index import NumpyVectorIndex
 
 SCHEMA_FILE = Path("AE_Json_Schema.json")
+XSD_FILE = Path("AE_XSD_schema.xsd")
 COLLECTION_NAME = "ae_schema"
 EMBED_MODEL = "all-MiniLM-L6-v2"
+VECTOR_INDEX_DIR = Path("vector_index")
+BATCH_SIZE = 64
 
 def extract_chunks(schema: dict):
     """
@@ -40,34 +49,80 @@ def extract_chunks(schema: dict):
     return chunks
 
 
+def chunk_id(text: str, metadata: dict) -> str:
+    """Stable id derived from the chunk, its metadata and the model that embeds it."""
+    key = f"{EMBED_MODEL}\n{text}\n{json.dumps(metadata, sort_keys=True)}"
+    return hashlib.sha256(key.encode("utf-8")).hexdigest()[:32]
+
+
 def main():
-    print("Building ChromaDB index...")
+    parser = argparse.ArgumentParser(description="Index AE_Json_Schema.json into ChromaDB.")
+    parser.add_argument("--rebuild", action="store_true",
+                        help="drop the collection and re-embed every chunk")
+    parser.add_argument("--chunker", choices=["structured", "leaf"], default="structured",
+                        help="one chunk per schema element/type (default) or per JSON leaf value")
+    args = parser.parse_args()
+
+    print("Updating ChromaDB index...")
     client = chromadb.PersistentClient(path="./chroma_db")
 
-    try:
-        client.delete_collection(COLLECTION_NAME)
-    except Exception:
-        pass
+    if args.rebuild:
+        try:
+            client.delete_collection(COLLECTION_NAME)
+        except Exception:
+            pass
 
-    collection = client.create_collection(COLLECTION_NAME)
-    model = SentenceTransformer(EMBED_MODEL)
+    collection = client.get_or_create_collection(COLLECTION_NAME)
 
     schema = json.loads(SCHEMA_FILE.read_text(encoding="utf-8"))
-    chunks = extract_chunks(schema)
-
-    print(f"Extracted {len(chunks)} schema chunks, encoding...")
-    embeddings = model.encode(chunks, batch_size=32, show_progress_bar=True)
-
-    print("Indexing into ChromaDB...")
-    for i in tqdm(range(0, len(chunks), 64), desc="Indexing Chunks"):
-        batch = chunks[i:i + 64]
-        collection.add(
-            ids=[str(i + j) for j in range(len(batch))],
-            embeddings=embeddings[i:i + len(batch)].tolist(),
-            documents=batch
+    if args.chunker == "structured":
+        chunks = structured_chunks(schema, XSD_FILE)
+    else:
+        chunks = [(chunk, {"kind": "leaf"}) for chunk in extract_chunks(schema)]
+    # Identical chunks share an id, so keep the first of each.
+    unique = {}
+    for chunk in chunks:
+        unique.setdefault(chunk_id(*chunk), chunk)
+    chunks = list(unique.items())
+    ids = [cid for cid, _ in chunks]
+
+    # A changed chunk gets a new id: it is embedded as new and its old id is stale.
+    stored = set(collection.get(include=[])["ids"])
+    new = [(cid, chunk) for cid, chunk in chunks if cid not in stored]
+    stale = sorted(stored - set(ids))
+    print(f"Extracted {len(chunks)} schema chunks: {len(new)} new or changed, {len(stale)} stale")
+
+    for i in range(0, len(stale), BATCH_SIZE):
+        collection.delete(ids=stale[i:i + BATCH_SIZE])
+
+    if new:
+        # Chunks embedded by an earlier run (e.g. before --rebuild) come from the cache;
+        # the transformer is only loaded when something is left to encode.
+        print("Encoding new chunks...")
+        embeddings = EmbeddingCache(EMBED_MODEL).encode(
+            [text for _, (text, _) in new],
+            lambda texts: SentenceTransformer(EMBED_MODEL).encode(texts, batch_size=32, show_progress_bar=True),
         )
 
-    print(f"Indexed {len(chunks)} schema chunks into {COLLECTION_NAME}")
+        print("Indexing into ChromaDB...")
+        for i in tqdm(range(0, len(new), BATCH_SIZE), desc="Indexing Chunks"):
+            batch = new[i:i + BATCH_SIZE]
+            collection.upsert(
+                ids=[cid for cid, _ in batch],
+                embeddings=embeddings[i:i + len(batch)].tolist(),
+                documents=[text for _, (text, _) in batch],
+                metadatas=[metadata for _, (_, metadata) in batch],
+            )
+
+    print(f"{COLLECTION_NAME} now holds {collection.count()} schema chunks")
+
+    # Same embeddings, in chunk order, for RagRetriever(backend="numpy")
+    stored = collection.get(ids=ids, include=["embeddings"])
+    by_id = dict(zip(stored["ids"], stored["embeddings"]))
+    NumpyVectorIndex.save(VECTOR_INDEX_DIR, [by_id[cid] for cid in ids],
+                          [text for _, (text, _) in chunks], [metadata for _, (_, metadata) in chunks])
+    LexicalIndex.save(VECTOR_INDEX_DIR, [text for _, (text, _) in chunks], [metadata for _, (_, metadata) in chunks])
+    print(f"Wrote in-process vector and BM25 indexes to {VECTOR_INDEX_DIR}")
 
 if __name__ == "__main__":
     main()
@@ -1,12 +1,57 @@
-import chromadb
 from sentence_transformers import SentenceTransformer
 import numpy as np
+from embedding_cache import EmbeddingCache
+from lexical_index import LexicalIndex, fuse
+
+EMBED_MODEL = "all-MiniLM-L6-v2"
 
 class RagRetriever:
-    def __init__(self, db_path="./chroma_db", collection_name="ae_schema"):
-        self.client = chromadb.PersistentClient(path=db_path)
-        self.collection = self.client.get_collection(collection_name)
-        self.model = SentenceTransformer("all-MiniLM-L6-v2")
+    def __init__(self, db_path="./chroma_db", collection_name="ae_schema",
+                 backend="chroma", index_path="./vector_index"):
+        """
+        backend="chroma" queries the persistent Chroma collection;
+        backend="numpy" answers from the in-process memory-mapped matrix that
+        rag_indexer.py writes to index_path, with no Chroma/SQLite round trip.
+        """
+        if backend == "numpy":
+            from vector_index import NumpyVectorIndex
+            self.index = NumpyVectorIndex(index_path)
+            self.collection = None
+        elif backend == "chroma":
+            import chromadb
+            self.client = chromadb.PersistentClient(path=db_path)
+            self.collection = self.client.get_collection(collection_name)
+            self.index = None
+        else:
+            raise ValueError(f"unknown retriever backend {backend!r}")
+        # BM25 index written by rag_indexer.py; without it retrieval is dense only.
+        try:
+            self.lexical = LexicalIndex(index_path)
+        except OSError:
+            self.lexical = None
+        # Repeated queries are answered from the embedding cache; the
+        # transformer is only loaded for the first query that misses it.
+        self.cache = EmbeddingCache(EMBED_MODEL)
+        self._model = None
+
+    @property
+    def model(self):
+        if self._model is None:
+            self._model = SentenceTransformer(EMBED_MODEL)
+        return self._model
+
+    def _encode(self, texts):
+        return self.model.encode(texts)
+
+    def _query(self, query_embed, top_k: int, where=None):
+        if self.index is not None:
+            return self.index.query(query_embed, top_k, where=where)
+        results = self.collection.query(
+            query_embeddings=[query_embed.tolist()],
+            n_results=top_k,
+            where=where,
+        )
+        return results["documents"][0]
 
     def _keyword_filter(self, query: str):
         keywords = []
@@ -19,21 +64,29 @@ class RagRetriever:
             keywords.append("AeNetworkTopologyType")
         return keywords or ["AeCpuCluster", "AeChipletType"]
 
-    def retrieve(self, query: str, top_k: int = 8):
+    @staticmethod
+    def _where(keywords):
+        """Metadata filter for chunks inside any of the given schema types (see schema_chunker)."""
+        conditions = [{f"in_{keyword}": True} for keyword in keywords]
+        return conditions[0] if len(conditions) == 1 else {"$or": conditions}
+
+    def retrieve(self, query: str, top_k: int = 5):
         """Retrieve schema context most relevant to the user query."""
         keywords = self._keyword_filter(query)
-        query_embed = self.model.encode(query)
-        results = self.collection.query(
-            query_embeddings=[query_embed.tolist()],
-            n_results=top_k,
-        )
 
-        # Filter results for relevant schema types
-        docs = results["documents"][0]
-        filtered = [d for d in docs if any(k in d for k in keywords)]
-        if not filtered:
-            filtered = docs
+        # A query made only of schema names is looked up without embedding it.
+        docs = self.lexical.exact(query, top_k) if self.lexical is not None else None
+        if not docs:
+            query_embed = self.cache.encode([query], self._encode)[0]
+            # Only chunks of the relevant schema types are ranked; an index built
+            # without type metadata (e.g. --chunker leaf) matches none of them.
+            docs = self._query(query_embed, top_k, where=self._where(keywords))
+            if not docs:
+                docs = self._query(query_embed, top_k)
+            # Literal tokens (UCIe, CAN-FD, ...) are matched by BM25 over all types.
+            if self.lexical is not None:
+                docs = fuse(docs, self.lexical.search(query, top_k))[:top_k]
 
         # Compact summary to make prompt concise
-        context = "\n---\n".join(filtered[:5])
+        context = "\n---\n".join(docs)
         return f"Relevant schema snippets ({', '.join(keywords)}):\n{context}"
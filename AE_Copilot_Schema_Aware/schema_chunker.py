@@ -0,0 +1,167 @@
+"""
+Structure-aware chunking of the AE schema for the RAG index.
+
+Instead of one chunk per scalar leaf of AE_Json_Schema.json, every schema
+element becomes one compact chunk (xpath, type, occurrence, children,
+attributes, enumerations, bounds, documentation), and every named XSD type
+one more. Empty and null fields are left out.
+"""
+from pathlib import Path
+
+import xmlschema
+
+XSD_NAMESPACE = "http://www.w3.org/2001/XMLSchema"
+MIN_FACETS = (f"{{{XSD_NAMESPACE}}}minInclusive", f"{{{XSD_NAMESPACE}}}minExclusive")
+MAX_FACETS = (f"{{{XSD_NAMESPACE}}}maxInclusive", f"{{{XSD_NAMESPACE}}}maxExclusive")
+
+
+def _occurs(min_occurs, max_occurs) -> str:
+    low = "0" if min_occurs in (None, "") else str(min_occurs)
+    high = "unbounded" if max_occurs in (None, "unbounded") else str(max_occurs)
+    return f"{low}..{high}"
+
+
+def _doc(component) -> str | None:
+    annotation = getattr(component, "annotation", None)
+    text = " ".join(str(annotation).split()) if annotation is not None else ""
+    return text or None
+
+
+def _type_name(xsd_type) -> str | None:
+    while xsd_type is not None and not xsd_type.local_name:
+        xsd_type = getattr(xsd_type, "base_type", None)
+    return xsd_type.local_name if xsd_type is not None else None
+
+
+def _facets(xsd_type) -> list[str]:
+    facets = []
+    enumeration = getattr(xsd_type, "enumeration", None)
+    if enumeration:
+        facets.append("values " + "|".join(str(v) for v in enumeration))
+    # Only bounds the schema declares, not those of built-ins like xs:unsignedLong.
+    if getattr(xsd_type, "target_namespace", None) == XSD_NAMESPACE:
+        return facets
+    declared = getattr(xsd_type, "facets", None) or {}
+    low = xsd_type.min_value if any(k in declared for k in MIN_FACETS) else None
+    high = xsd_type.max_value if any(k in declared for k in MAX_FACETS) else None
+    if low is not None or high is not None:
+        facets.append(f"range {'' if low is None else low}..{'' if high is None else high}")
+    return facets
+
+
+def _attribute(name, attribute) -> str:
+    details = ["required" if attribute.use == "required" else "optional"]
+    if attribute.default is not None:
+        details.append(f"default {attribute.default}")
+    base = _type_name(attribute.type)
+    if base:
+        details.append(base)
+    details += _facets(attribute.type)
+    return f"{name} ({', '.join(details)})"
+
+
+def _xsd_lines(xsd_type) -> list[str]:
+    """Attribute and enumeration/bound lines of an XSD type."""
+    lines = []
+    attributes = getattr(xsd_type, "attributes", None) or {}
+    if attributes:
+        lines.append("attributes: " + "; ".join(_attribute(n, a) for n, a in attributes.items()))
+    facets = _facets(xsd_type)
+    if facets:
+        lines.append("content: " + ", ".join(facets))
+    return lines
+
+
+def _children(node: dict) -> list[str]:
+    children = []
+    for child in node.get("elements") or []:
+        if child.get("xpath"):
+            children.append(f"{child['name']} ({_occurs(child.get('minOccurs'), child.get('maxOccurs'))})")
+        else:  # a choice group without an element of its own
+            children.append("one of: " + " | ".join(_children(child)))
+    return children
+
+
+def _named_types(xsd_type, xsd) -> list[str]:
+    """A named schema type and the named schema types it extends or restricts."""
+    names = []
+    while xsd_type is not None and xsd_type.local_name in xsd.types:
+        names.append(xsd_type.local_name)
+        xsd_type = getattr(xsd_type, "base_type", None)
+    return names
+
+
+def chunk_metadata(kind: str, name: str, xpath: str, owners) -> dict:
+    """
+    Scalar metadata Chroma can filter on: the element or type name, the
+    nearest owning type, and one in_<Type> flag for every type the chunk lies
+    within (own type, ancestors' types and their bases), so
+    {"in_AeCpuCluster": True} selects every chunk inside any CPU cluster
+    variant.
+    """
+    metadata = {"kind": kind, "name": name, "xpath": xpath, "depth": xpath.count("/") if xpath else 0,
+                "owner": owners[-1] if owners else ""}
+    metadata.update((f"in_{owner}", True) for owner in owners)
+    return metadata
+
+
+def element_chunks(node: dict, xsd=None, owners: tuple = ()):
+    """
+    One (text, metadata) chunk per element of the AE_Json_Schema.json element
+    tree; owners are the named XSD types of the element and its ancestors.
+    """
+    if node.get("xpath"):
+        lines = [f"Schema element: {node['name']}", f"xpath: {node['xpath']}"]
+        element = xsd.find(node["xpath"]) if xsd is not None else None
+        if element is not None and _type_name(element.type):
+            lines.append(f"type: {_type_name(element.type)}")
+            owners += tuple(reversed(_named_types(element.type, xsd)))
+        lines.append(f"occurs: {_occurs(node.get('minOccurs'), node.get('maxOccurs'))}")
+        for key in ("dataType", "minLength", "maxLength", "pattern", "minInclusive", "maxInclusive"):
+            if node.get(key) not in (None, ""):
+                lines.append(f"{key}: {node[key]}")
+        if node.get("values"):
+            lines.append("values: " + "|".join(str(v) for v in node["values"]))
+        children = _children(node)
+        if children:
+            lines.append("children: " + ", ".join(children))
+        if element is not None:
+            lines += _xsd_lines(element.type)
+            doc = _doc(element)
+            if doc:
+                lines.append(f"documentation: {doc}")
+        yield "\n".join(lines), chunk_metadata("element", node["name"], node["xpath"], owners)
+    for child in node.get("elements") or []:
+        yield from element_chunks(child, xsd, owners)
+
+
+def type_chunks(xsd):
+    """One (text, metadata) chunk per named XSD type (AeCpuCluster, AeChipletType, ...)."""
+    for name, xsd_type in xsd.types.items():
+        lines = [f"Schema type: {name}"]
+        base = getattr(xsd_type, "base_type", None)
+        if base is not None and base.local_name and base.local_name != "anyType":
+            lines.append(f"extends: {base.local_name}")
+        content = getattr(xsd_type, "content", None)
+        if content is not None and hasattr(content, "iter_elements"):
+            children = [f"{e.local_name}: {_type_name(e.type) or 'inline'} ({_occurs(e.min_occurs, e.max_occurs)})"
+                        for e in content.iter_elements()]
+            if children:
+                lines.append("children: " + ", ".join(children))
+        lines += _xsd_lines(xsd_type)
+        doc = _doc(xsd_type)
+        if doc:
+            lines.append(f"documentation: {doc}")
+        yield "\n".join(lines), chunk_metadata("type", name, "", tuple(reversed(_named_types(xsd_type, xsd))))
+
+
+def structured_chunks(schema: dict, xsd_path=None) -> list[tuple[str, dict]]:
+    """
+    (text, metadata) chunks: the elements of the JSON schema, enriched from
+    the XSD, followed by the XSD's named types, with chunk_metadata.
+    """
+    xsd = xmlschema.XMLSchema(str(xsd_path)) if xsd_path and Path(xsd_path).is_file() else None
+    chunks = list(element_chunks(schema["schemaElement"], xsd))
+    if xsd is not None:
+        chunks += type_chunks(xsd)
+    return chunks
@@ -0,0 +1,91 @@
+import json
+from pathlib import Path
+
+import numpy as np
+
+VECTORS_FILE = "vectors.npy"
+DOCUMENTS_FILE = "documents.json"
+METADATA_FILE = "metadata.json"
+
+
+def normalize_rows(matrix: np.ndarray) -> np.ndarray:
+    matrix = np.asarray(matrix, dtype=np.float32)
+    norms = np.linalg.norm(matrix, axis=-1, keepdims=True)
+    return matrix / np.maximum(norms, 1e-12)
+
+
+def matches(metadata: dict, where: dict) -> bool:
+    """The subset of Chroma's where syntax the retriever uses: $and, $or, $in, $eq and equality."""
+    for key, condition in where.items():
+        if key == "$and":
+            if not all(matches(metadata, c) for c in condition):
+                return False
+        elif key == "$or":
+            if not any(matches(metadata, c) for c in condition):
+                return False
+        elif isinstance(condition, dict):
+            value = metadata.get(key)
+            if "$in" in condition and value not in condition["$in"]:
+                return False
+            if "$eq" in condition and value != condition["$eq"]:
+                return False
+        elif metadata.get(key) != condition:
+            return False
+    return True
+
+
+class NumpyVectorIndex:
+    """
+    In-process alternative to the Chroma collection: the chunk embeddings are
+    one contiguous, L2-normalised float32 matrix memory-mapped from disk, and a
+    query is a single matrix-vector product plus argpartition for the top k.
+    """
+
+    def __init__(self, path="./vector_index"):
+        path = Path(path)
+        self.vectors = np.load(path / VECTORS_FILE, mmap_mode="r")
+        self.documents = json.loads((path / DOCUMENTS_FILE).read_text(encoding="utf-8"))
+        if len(self.documents) != len(self.vectors):
+            raise ValueError(f"{path} is inconsistent: {len(self.vectors)} vectors, "
+                             f"{len(self.documents)} documents")
+        metadata_file = path / METADATA_FILE
+        self.metadatas = (json.loads(metadata_file.read_text(encoding="utf-8"))
+                          if metadata_file.is_file() else [{} for _ in self.documents])
+        self._rows = {}  # where filter -> matching row numbers
+
+    @staticmethod
+    def save(path, embeddings, documents, metadatas=None):
+        """Write the matrix, documents and metadata; the matrix is replaced atomically."""
+        path = Path(path)
+        path.mkdir(parents=True, exist_ok=True)
+        tmp = path / (VECTORS_FILE + ".tmp")
+        with open(tmp, "wb") as f:
+            np.save(f, np.ascontiguousarray(normalize_rows(embeddings)))
+        tmp.replace(path / VECTORS_FILE)
+        (path / DOCUMENTS_FILE).write_text(json.dumps(list(documents)), encoding="utf-8")
+        if metadatas is not None:
+            (path / METADATA_FILE).write_text(json.dumps(list(metadatas)), encoding="utf-8")
+
+    def rows(self, where: dict) -> np.ndarray:
+        """Row numbers of the chunks whose metadata matches where, computed once per filter."""
+        key = json.dumps(where, sort_keys=True)
+        if key not in self._rows:
+            self._rows[key] = np.flatnonzero([matches(m, where) for m in self.metadatas])
+        return self._rows[key]
+
+    def query(self, embedding, top_k: int = 8, where: dict | None = None) -> list[str]:
+        """
+        Documents of the top_k chunks by cosine similarity, best first. With
+        where, only the chunks whose metadata matches are scored.
+        """
+        rows = self.rows(where) if where else None
+        vectors = self.vectors if rows is None else self.vectors[rows]
+        if not len(vectors):
+            return []
+        scores = vectors @ normalize_rows(embedding)
+        k = min(top_k, len(scores))
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top])]
+        if rows is not None:
+            top = rows[top]
+        return [self.documents[i] for i in top]
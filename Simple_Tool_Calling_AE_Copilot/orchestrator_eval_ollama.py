@@ -1,13 +1,18 @@
 import json
 import subprocess
+import sys
 import time
+from pathlib import Path
 from typing import Optional, List
 from pydantic import ValidationError
 
-from ae_xsd_schema import (
+# The generated models live in the shared generated_models package at the repo root.
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from generated_models.ae_xsd_schema import (
     AeCpuCluster,
     AeChipletType,
 )
+from src.model_dispatch import validate_data, validate_json
 
 def normalize_cpu_cluster(data: dict) -> dict:
     # Normalize short_name
@@ -173,6 +178,12 @@ def parse_json_schema(output: str, schema) -> Optional[dict]:
         return None
     j = auto_close_json(j)
     try:
+        # Well-formed output is validated straight from the JSON text; only
+        # fall back to json.loads and the normalizers when that fails.
+        try:
+            return validate_json(j, schema).model_dump(mode="json")
+        except ValidationError:
+            pass
         data = json.loads(j)
         if isinstance(data, dict) and len(data) == 1:
             key = next(iter(data))
@@ -182,7 +193,7 @@ def parse_json_schema(output: str, schema) -> Optional[dict]:
             data = normalize_chiplet(data)
         elif schema is AeCpuCluster:
             data = normalize_cpu_cluster(data)
-        obj = schema(**data)
+        obj = validate_data(data, schema)
         return obj.model_dump(mode="json")
     except (ValidationError, Exception) as e:
         print("❌ JSON parse failed:", e)
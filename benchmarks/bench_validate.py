@@ -0,0 +1,334 @@
+"""
+Validation throughput benchmark.
+
+Times schema loading, per-file validation of the xmls/ corpus, validation of
+synthetically scaled documents (copies of one ECU), pydantic ArPackage
+construction, and direct XML-to-ArPackage binding of the corpus and the
+scaled documents, then writes the results as JSON so runs can be compared.
+Scaled documents are generated in this process and measured in a fresh one,
+so peak_rss_delta_mb covers validation or binding only.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_validate -o bench.json
+    python -m benchmarks.bench_validate -o new.json --compare bench.json
+"""
+import argparse
+import copy
+import json
+import multiprocessing
+import platform
+import resource
+import sys
+import tempfile
+import time
+import xml.etree.ElementTree as ET
+from datetime import datetime, timezone
+from pathlib import Path
+
+import xmlschema
+from lxml import etree
+
+from validate_xml import DEFAULT_SCHEMA, ENGINES, load_schema, timed_errors
+
+ROOT = Path(__file__).resolve().parent.parent
+CORPUS = ROOT / "xmls"
+SCALE_TEMPLATE = CORPUS / "Ecu_to_Ecu_CANFD_comm.xml"
+DEFAULT_SCALES = (10, 100, 1000)
+
+# Metrics where a larger value is worse; everything else is a throughput.
+LOWER_IS_BETTER = ("seconds", "peak_rss_mb", "peak_rss_delta_mb")
+
+
+def peak_rss_mb() -> float:
+    # ru_maxrss is in KiB on Linux and bytes on macOS.
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss / (1024 * 1024) if sys.platform == "darwin" else rss / 1024
+
+
+def make_scaled_document(n_ecus: int, template: Path = SCALE_TEMPLATE) -> bytes:
+    """
+    Return the template document with its ECUs replaced by n_ecus copies of
+    the first one, renamed ECU<i>/SoC<i>. Note that the XSD allows at most
+    100 ECUs, so larger documents are expected to report an error.
+    """
+    tree = ET.parse(template)
+    elements = tree.getroot().find("ELEMENTS")
+    ecus = elements.findall("ECUs")
+    position = list(elements).index(ecus[0])
+    for ecu in ecus:
+        elements.remove(ecu)
+    for i in range(n_ecus):
+        ecu = copy.deepcopy(ecus[0])
+        ecu.find("SHORT-NAME").set("name", f"ECU{i}")
+        ecu.find("SoCs/SHORT-NAME").set("name", f"SoC{i}")
+        elements.insert(position + i, ecu)
+    return ET.tostring(tree.getroot(), encoding="utf-8", xml_declaration=True)
+
+
+def bench_schema_load(schema_path: Path) -> dict:
+    start = time.perf_counter()
+    load_schema(schema_path, use_cache=False)
+    built = time.perf_counter()
+    load_schema(schema_path, use_cache=True)  # make sure the cache is populated
+    cached_start = time.perf_counter()
+    load_schema(schema_path, use_cache=True)
+    return {
+        "build_seconds": built - start,
+        "cached_seconds": time.perf_counter() - cached_start,
+    }
+
+
+def bench_corpus(engine, corpus: Path, repeat: int) -> dict:
+    files, skipped = [], []
+    for xml_file in sorted(corpus.glob("*.xml")):
+        try:
+            engine.timed_errors(xml_file)
+            files.append(xml_file)
+        except (xmlschema.XMLResourceError, etree.XMLSyntaxError):
+            skipped.append(xml_file.name)
+
+    per_file = {}
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for xml_file in files:
+            _, timing, _ = engine.timed_errors(xml_file)
+            best = per_file.get(xml_file.name)
+            total = timing["parse"] + timing["validate"]
+            if best is None or total < best["parse"] + best["validate"]:
+                per_file[xml_file.name] = timing
+    elapsed = time.perf_counter() - start
+    size_mb = sum(f.stat().st_size for f in files) * repeat / 1e6
+    return {
+        "files": len(files),
+        "skipped_malformed": skipped,
+        "seconds": elapsed,
+        "files_per_sec": len(files) * repeat / elapsed,
+        "mb_per_sec": size_mb / elapsed,
+        "per_file": per_file,
+    }
+
+
+def _bench_scaled(schema_path: str, xml_file: str, n_ecus: int, stream: bool) -> dict:
+    # Runs in a fresh spawned process so peak RSS belongs to this case only;
+    # the document was written by the parent.
+    schema = load_schema(Path(schema_path))
+    rss_before = peak_rss_mb()
+    errors, timing, _ = timed_errors(schema, Path(xml_file), stream=stream)
+    size_mb = Path(xml_file).stat().st_size / 1e6
+    elapsed = timing["parse"] + timing["validate"]
+    return {
+        "ecus": n_ecus,
+        "stream": stream,
+        "size_mb": size_mb,
+        "errors": len(errors),
+        "parse_seconds": timing["parse"],
+        "validate_seconds": timing["validate"],
+        "seconds": elapsed,
+        "mb_per_sec": size_mb / elapsed,
+        "peak_rss_mb": peak_rss_mb(),
+        "peak_rss_delta_mb": peak_rss_mb() - rss_before,
+    }
+
+
+def bench_scaled(schema_path: Path, xml_file: Path, n_ecus: int, stream: bool = False) -> dict:
+    ctx = multiprocessing.get_context("spawn")
+    with ctx.Pool(1) as pool:
+        return pool.apply(_bench_scaled, (str(schema_path), str(xml_file), n_ecus, stream))
+
+
+def ecu_dict(i: int) -> dict:
+    return {
+        "short_name": {"name": f"ECU{i}"},
+        "so_cs": [{
+            "short_name": {"name": f"SoC{i}"},
+            "axi_bus": {"width": 4, "frequency": 100000000},
+            "ethernet_interface": {"mode": "simulated"},
+            "ucie_interface": {"mode": "host"},
+        }],
+    }
+
+
+def bench_pydantic(scales) -> dict:
+    from generated_models.ae_xsd_schema import ArPackage
+    from src.model_warmup import warm_up
+
+    results = {"warm_up_seconds": warm_up()["seconds"]}
+    start = time.perf_counter()
+    ArPackage.model_validate({"elements": [{"ecus": [ecu_dict(0)]}]})
+    results["first_use_seconds"] = time.perf_counter() - start
+    for n in scales:
+        data = {"elements": [{"ecus": [ecu_dict(i) for i in range(n)]}]}
+        start = time.perf_counter()
+        ArPackage.model_validate(data)
+        elapsed = time.perf_counter() - start
+        results[f"ecus_{n}"] = {"seconds": elapsed, "ecus_per_sec": n / elapsed}
+    return results
+
+
+def bench_corpus_binding(corpus: Path, repeat: int) -> dict:
+    """Best-of-repeat time to bind each xmls/ file onto ArPackage; files it rejects are skipped."""
+    from src.model_warmup import warm_up
+    from src.xml_binding import parse_ar_package
+
+    warm_up()
+    files, skipped = [], []
+    for xml_file in sorted(corpus.glob("*.xml")):
+        try:
+            parse_ar_package(xml_file)
+            files.append(xml_file)
+        except (ValueError, etree.XMLSyntaxError):
+            skipped.append(xml_file.name)
+
+    per_file = {}
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for xml_file in files:
+            file_start = time.perf_counter()
+            parse_ar_package(xml_file)
+            elapsed = time.perf_counter() - file_start
+            per_file[xml_file.name] = min(elapsed, per_file.get(xml_file.name, elapsed))
+    elapsed = time.perf_counter() - start
+    return {
+        "files": len(files),
+        "skipped_invalid": skipped,
+        "seconds": elapsed,
+        "files_per_sec": len(files) * repeat / elapsed,
+        "per_file": per_file,
+    }
+
+
+def _bench_binding(xml_file: str, n_ecus: int) -> dict:
+    # Spawned like _bench_scaled, so peak RSS covers the binding only.
+    from src.model_warmup import warm_up
+    from src.xml_binding import parse_ar_package
+
+    warm_up()
+    rss_before = peak_rss_mb()
+    start = time.perf_counter()
+    parse_ar_package(Path(xml_file))
+    elapsed = time.perf_counter() - start
+    size_mb = Path(xml_file).stat().st_size / 1e6
+    return {
+        "ecus": n_ecus,
+        "size_mb": size_mb,
+        "seconds": elapsed,
+        "ecus_per_sec": n_ecus / elapsed,
+        "peak_rss_delta_mb": peak_rss_mb() - rss_before,
+    }
+
+
+def bench_binding(xml_file: Path, n_ecus: int) -> dict:
+    ctx = multiprocessing.get_context("spawn")
+    with ctx.Pool(1) as pool:
+        return pool.apply(_bench_binding, (str(xml_file), n_ecus))
+
+
+def run(schema_path: Path, scales, repeat: int) -> dict:
+    results = {"schema_load": bench_schema_load(schema_path)}
+    for name, engine in ENGINES.items():
+        key = "corpus" if name == "xmlschema" else f"corpus_{name}"
+        results[key] = bench_corpus(engine(schema_path), CORPUS, repeat)
+    with tempfile.TemporaryDirectory() as tmp:
+        for n in scales:
+            xml_file = Path(tmp) / f"scaled_{n}.xml"
+            xml_file.write_bytes(make_scaled_document(n))
+            results[f"scaled_{n}"] = bench_scaled(schema_path, xml_file, n)
+            results[f"scaled_{n}_stream"] = bench_scaled(schema_path, xml_file, n, stream=True)
+            results[f"binding_{n}"] = bench_binding(xml_file, n)
+            xml_file.unlink()
+    results["pydantic"] = bench_pydantic(scales)
+    results["binding_corpus"] = bench_corpus_binding(CORPUS, repeat)
+    return {
+        "meta": {
+            "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "xmlschema": xmlschema.__version__,
+            "schema": str(schema_path),
+        },
+        "results": results,
+    }
+
+
+def flatten(results: dict, prefix: str = "") -> dict:
+    flat = {}
+    for key, value in results.items():
+        name = f"{prefix}{key}"
+        if isinstance(value, dict):
+            if key != "per_file":
+                flat.update(flatten(value, f"{name}."))
+        elif isinstance(value, (int, float)) and not isinstance(value, bool):
+            flat[name] = value
+    return flat
+
+
+def compare(current: dict, baseline: dict, threshold: float) -> list[str]:
+    """Print metric ratios against a baseline and return the regressed metrics."""
+    now, before = flatten(current["results"]), flatten(baseline["results"])
+    regressions = []
+    print(f"\n{'metric':<45} {'baseline':>12} {'current':>12} {'change':>8}")
+    for name in sorted(now.keys() & before.keys()):
+        old, new = before[name], now[name]
+        if not old or not (name.endswith(LOWER_IS_BETTER) or name.endswith("_per_sec")):
+            continue
+        change = (new - old) / old
+        worse = change > threshold if name.endswith(LOWER_IS_BETTER) else change < -threshold
+        flag = "  REGRESSION" if worse else ""
+        print(f"{name:<45} {old:>12.4f} {new:>12.4f} {change:>+7.1%}{flag}")
+        if worse:
+            regressions.append(name)
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark AE XML validation throughput.")
+    parser.add_argument("--schema", type=Path, default=DEFAULT_SCHEMA)
+    parser.add_argument("--scales", type=int, nargs="*", default=list(DEFAULT_SCALES),
+                        help="ECU counts for the synthetic documents (default: 10 100 1000)")
+    parser.add_argument("--repeat", type=int, default=3, help="passes over the xmls/ corpus (default: 3)")
+    parser.add_argument("-o", "--output", type=Path, help="write the results as JSON to this file")
+    parser.add_argument("--compare", type=Path, help="baseline JSON file from an earlier run")
+    parser.add_argument("--threshold", type=float, default=0.10,
+                        help="relative slowdown counted as a regression (default: 0.10)")
+    args = parser.parse_args()
+
+    report = run(args.schema, args.scales, args.repeat)
+    results = report["results"]
+    corpus = results["corpus"]
+    print(f"Schema build: {results['schema_load']['build_seconds']:.3f}s, "
+          f"cached load: {results['schema_load']['cached_seconds']:.3f}s")
+    print(f"Corpus: {corpus['files']} files (skipped malformed: {', '.join(corpus['skipped_malformed']) or '-'})")
+    for key in ("corpus", "corpus_lxml", "corpus_auto"):
+        print(f"  {key}: {results[key]['files_per_sec']:.1f} files/s, {results[key]['mb_per_sec']:.2f} MB/s")
+    for n in args.scales:
+        for key in (f"scaled_{n}", f"scaled_{n}_stream"):
+            r = results[key]
+            print(f"{key}: {r['size_mb']:.2f} MB in {r['seconds']:.3f}s, {r['mb_per_sec']:.2f} MB/s, "
+                  f"peak RSS {r['peak_rss_mb']:.0f} MB (+{r['peak_rss_delta_mb']:.0f} MB validating), "
+                  f"{r['errors']} errors")
+    print(f"Pydantic warm-up: {results['pydantic']['warm_up_seconds']:.3f}s, "
+          f"first use after it: {results['pydantic']['first_use_seconds']:.4f}s")
+    for n in args.scales:
+        r = results["pydantic"][f"ecus_{n}"]
+        print(f"Pydantic ArPackage with {n} ECUs: {r['seconds']:.4f}s ({r['ecus_per_sec']:.0f} ECUs/s)")
+    r = results["binding_corpus"]
+    print(f"XML binding of the corpus: {r['files']} files, {r['files_per_sec']:.1f} files/s "
+          f"(skipped invalid: {', '.join(r['skipped_invalid']) or '-'})")
+    for n in args.scales:
+        r = results[f"binding_{n}"]
+        print(f"XML binding with {n} ECUs: {r['size_mb']:.2f} MB in {r['seconds']:.4f}s "
+              f"({r['ecus_per_sec']:.0f} ECUs/s), +{r['peak_rss_delta_mb']:.0f} MB peak RSS")
+
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2), encoding="utf-8")
+        print(f"\nResults written to {args.output}")
+    if args.compare:
+        regressions = compare(report, json.loads(args.compare.read_text(encoding="utf-8")), args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} metric(s) regressed by more than {args.threshold:.0%}")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""
+Regenerate the generated_models package from AE_XSD_schema.xsd.
+
+Runs xsdata's pydantic generator (pip install "xsdata-pydantic[cli]", needed
+only for this step) into a scratch directory and rewrites its
+xsdata_pydantic.fields.field helper to plain pydantic Field, so the generated
+package only needs pydantic at runtime. The package __init__ is rewritten to
+load the model module lazily on first attribute access.
+
+    python generate_models.py            # rewrite generated_models/
+    python generate_models.py --check    # exit 1 if generated_models/ is stale
+"""
+import argparse
+import ast
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent
+DEFAULT_SCHEMA = ROOT / "AE_XSD_schema.xsd"
+PACKAGE = "generated_models"
+
+
+def to_plain_pydantic(source: str) -> str:
+    """Drop the xsdata_pydantic runtime dependency from a generated module."""
+    source = source.replace("from xsdata_pydantic.fields import field\n", "from pydantic import Field\n")
+    return re.sub(r"\bfield\(", "Field(", source)
+
+
+LAZY_INIT = '''"""
+Generated by generate_models.py from AE_XSD_schema.xsd; do not edit.
+
+Classes are loaded on first access (PEP 562), so importing the package stays
+cheap until a model such as AeCpuCluster is actually used.
+"""
+import importlib
+
+__all__ = [
+{names}
+]
+
+
+def __getattr__(name):
+    if name in __all__:
+        value = getattr(importlib.import_module("{module}", __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {{__name__!r}} has no attribute {{name!r}}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+'''
+
+
+def lazy_init(source: str) -> str:
+    """Turn xsdata's eager package __init__ into one that imports on first attribute access."""
+    imports = [node for node in ast.parse(source).body if isinstance(node, ast.ImportFrom)]
+    modules = {node.module for node in imports}
+    if len(modules) != 1:
+        raise ValueError(f"expected the models in one module, got {sorted(modules)}")
+    names = [alias.name for node in imports for alias in node.names]
+    return LAZY_INIT.format(
+        module="." + modules.pop().rpartition(".")[2],
+        names="\n".join(f'    "{name}",' for name in names),
+    )
+
+
+def generate(schema_path: Path) -> dict[str, str]:
+    """Return {file name: content} of the freshly generated package."""
+    with tempfile.TemporaryDirectory() as tmp:
+        subprocess.run(
+            ["xsdata", "generate", str(Path(schema_path).resolve()),
+             "--package", PACKAGE, "--output", "pydantic"],
+            cwd=tmp, check=True, stdout=subprocess.DEVNULL,
+        )
+        modules = {
+            module.name: to_plain_pydantic(module.read_text(encoding="utf-8"))
+            for module in sorted((Path(tmp) / PACKAGE).glob("*.py"))
+        }
+    modules["__init__.py"] = lazy_init(modules["__init__.py"])
+    return modules
+
+
+def main():
+    parser = argparse.ArgumentParser(description=f"Regenerate {PACKAGE}/ from the AE XSD.")
+    parser.add_argument("schema", nargs="?", type=Path, default=DEFAULT_SCHEMA)
+    parser.add_argument("--check", action="store_true",
+                        help=f"only report whether {PACKAGE}/ matches the XSD")
+    args = parser.parse_args()
+
+    if shutil.which("xsdata") is None:
+        sys.exit('xsdata not found; install it with: pip install "xsdata-pydantic[cli]"')
+
+    target = ROOT / PACKAGE
+    modules = generate(args.schema)
+    stale = [name for name, content in modules.items()
+             if not (target / name).is_file() or (target / name).read_text(encoding="utf-8") != content]
+    if args.check:
+        if stale:
+            print(f"{PACKAGE}/ is out of date with {args.schema}: {', '.join(stale)}")
+            sys.exit(1)
+        print(f"{PACKAGE}/ is up to date")
+        return
+
+    target.mkdir(exist_ok=True)
+    for name in stale:
+        (target / name).write_text(modules[name], encoding="utf-8")
+    print(f"Regenerated {len(stale)} of {len(modules)} module(s) in {target}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+Generated by generate_models.py from AE_XSD_schema.xsd; do not edit.
+
+Classes are loaded on first access (PEP 562), so importing the package stays
+cheap until a model such as AeCpuCluster is actually used.
+"""
+import importlib
+
+__all__ = [
+    "AeAnalyseSimtime",
+    "AeAnalysisType",
+    "AeAxiBusType",
+    "AeChipletType",
+    "AeCpuArchType",
+    "AeCpuCluster",
+    "AeCpuCore",
+    "AeCpuFrequency",
+    "AeD2DconfigType",
+    "AeDataReceivedEventType",
+    "AeDualCoreCluster",
+    "AeDualCoreClusterCoresPerCluster",
+    "AeEndpointDmaconfigType",
+    "AeEthernetInterfaceType",
+    "AeEthernetInterfaceTypeMode",
+    "AeGenericHardwareType",
+    "AeGenericHwdataReceivedEventType",
+    "AeGenericHwfrequency",
+    "AeGenericHwtimingEventType",
+    "AeGenericHwtriggerEventType",
+    "AeHexaCoreCluster",
+    "AeHexaCoreClusterCoresPerCluster",
+    "AeHwSwMappingType",
+    "AeIdentity",
+    "AeInterfaceData",
+    "AeInterfaceType",
+    "AeNetworkTopologyType",
+    "AeOctaCoreCluster",
+    "AeOctaCoreClusterCoresPerCluster",
+    "AeOperationsSequenceType",
+    "AeOperationType",
+    "AeOsType",
+    "AePowerParameterType",
+    "AePreBuiltApplicationType",
+    "AeQuadCoreCluster",
+    "AeQuadCoreClusterCoresPerCluster",
+    "AeReference",
+    "AeSingleCoreCluster",
+    "AeSingleCoreClusterCoresPerCluster",
+    "AeSwcCustomBehaviorType",
+    "AeSwcType",
+    "AeTimeEventType",
+    "AeUcieInterfaceType",
+    "AeUcieInterfaceTypeMode",
+    "ArPackage",
+    "ChipletLinkLatencyUnit",
+    "LatencyUnit",
+    "LogicalIfDelayUnit",
+    "PeriodUnit",
+    "PhysicalIfDelayUnit",
+    "ProtocolConvLatencyUnit",
+    "SimulationTimeUnit",
+]
+
+
+def __getattr__(name):
+    if name in __all__:
+        value = getattr(importlib.import_module(".ae_xsd_schema", __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -1,18 +1,24 @@
 from enum import Enum
 from typing import Optional
 from pydantic import BaseModel, ConfigDict
-from pydantic import BaseModel, Field, conint
+from pydantic import Field
 
 
 class AeAnalyseSimtime(BaseModel):
     model_config = ConfigDict(defer_build=True)
     start_time: Optional[str] = Field(
         default=None,
-        alias="StartTime"
+        metadata={
+            "name": "StartTime",
+            "type": "Attribute",
+        },
     )
     end_time: Optional[str] = Field(
         default=None,
-        alias="EndTime"
+        metadata={
+            "name": "EndTime",
+            "type": "Attribute",
+        },
     )
 
 
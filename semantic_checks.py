@@ -0,0 +1,149 @@
+"""
+Semantic checks the XSD cannot express, run in one pass over the document.
+
+Every check receives each element once, in document order, together with the
+SHORT-NAME paths it can be referenced by, and reports its findings at the end.
+Findings use the same (path, reason) shape as schema errors.
+"""
+from collections import Counter
+from pathlib import Path
+from typing import NamedTuple
+
+from lxml import etree
+
+# Elements whose SHORT-NAME also opens a new reference root: references made
+# inside a Generic_Hardware address its ports as /<hw-name>/<port-name>.
+SCOPE_ELEMENTS = frozenset({"Generic_Hardware"})
+
+# Elements whose DEST is not a SHORT-NAME reference: PRE-BUILT-APPLICATION/PATH
+# holds the filesystem path of the application binary.
+NON_REFERENCE_ELEMENTS = frozenset({"PATH"})
+
+
+def is_reference_attribute(tag: str, name: str) -> bool:
+    """DEST on *-REF/*-TREF/IREF elements, and ClusterRef, RunnableRef, DestChipletRef, ..."""
+    if tag in NON_REFERENCE_ELEMENTS:
+        return False
+    return name == "DEST" or name.endswith("Ref")
+
+
+def normalize_reference(value: str) -> str:
+    # Some configs omit the leading slash (DEST="Interface1"); treat them as absolute.
+    return "/" + value.strip().lstrip("/")
+
+
+class ReferenceCheck:
+    """
+    Builds a hash index of every SHORT-NAME path while the document is walked
+    and collects every reference; references are resolved against the index
+    at the end, so the check stays linear in the document size.
+    """
+
+    def __init__(self):
+        self.index = set()
+        self.references = []
+
+    def start(self, elem, paths):
+        if paths:
+            self.index.update(paths)
+        for name, value in elem.attrib.items():
+            if is_reference_attribute(elem.tag, name):
+                self.references.append((elem, name, value))
+
+    def finish(self, tree):
+        return [
+            (tree.getpath(elem), f"{name} '{value}' does not resolve to any SHORT-NAME path")
+            for elem, name, value in self.references
+            if normalize_reference(value) not in self.index
+        ]
+
+
+class BudgetRule(NamedTuple):
+    """
+    At most `limit` elements tagged with one of `counted` may appear directly
+    under each element tagged with one of `scope`, or in the whole document
+    when scope is None.
+    """
+    counted: frozenset
+    scope: frozenset | None
+    limit: int
+    description: str
+
+
+# Limits documented on ECUs/SoCs in AE_XSD_schema.xsd that the XSD itself cannot enforce.
+BUDGET_RULES = (
+    BudgetRule(frozenset({"SoCs"}), None, 100, "SoCs in the system"),
+    BudgetRule(frozenset({"Chiplet", "CPU_Cluster"}), frozenset({"SoCs"}), 4,
+               "CPU_Cluster/Chiplets in this SoC"),
+    BudgetRule(frozenset({"Generic_Hardware"}), frozenset({"SoCs", "Chiplet"}), 32,
+               "Generic_Hardware in this SoC/Chiplet"),
+)
+
+
+class BudgetCheck:
+    """
+    Counts BUDGET_RULES occurrences per owning element in a Counter while the
+    document is walked, and reports the owners over budget at the end.
+    """
+
+    def __init__(self, rules=BUDGET_RULES):
+        self.rules = rules
+        self.counts = Counter()
+        self.rules_by_tag = {}
+        for i, rule in enumerate(rules):
+            for tag in rule.counted:
+                self.rules_by_tag.setdefault(tag, []).append(i)
+
+    def start(self, elem, paths):
+        for i in self.rules_by_tag.get(elem.tag, ()):
+            rule = self.rules[i]
+            if rule.scope is None:
+                self.counts[i, None] += 1
+            else:
+                parent = elem.getparent()
+                if parent is not None and parent.tag in rule.scope:
+                    self.counts[i, parent] += 1
+
+    def finish(self, tree):
+        errors = []
+        for (i, owner), count in self.counts.items():
+            rule = self.rules[i]
+            if count > rule.limit:
+                path = tree.getpath(owner if owner is not None else tree.getroot())
+                errors.append((path, f"{count} {rule.description}, at most {rule.limit} allowed"))
+        return errors
+
+
+# Check classes run by semantic_errors, each instantiated once per document.
+SEMANTIC_CHECKS = [ReferenceCheck, BudgetCheck]
+
+
+def walk(tree, checks):
+    """
+    Visit every element once, passing each check the element and the
+    SHORT-NAME paths it defines (empty for unnamed elements).
+    """
+    stack = [("",)]
+    for event, elem in etree.iterwalk(tree, events=("start", "end"), tag=etree.Element):
+        if event == "end":
+            stack.pop()
+            continue
+        bases = stack[-1]
+        paths = ()
+        short_name = elem.find("SHORT-NAME")
+        name = short_name.get("name") if short_name is not None else None
+        if name is not None:
+            paths = tuple(f"{base}/{name}" for base in bases)
+            if elem.tag in SCOPE_ELEMENTS:
+                paths += (f"/{name}",)
+            bases = paths
+        for check in checks:
+            check.start(elem, paths)
+        stack.append(bases)
+    return [error for check in checks for error in check.finish(tree)]
+
+
+def semantic_errors(xml_path: Path):
+    """Run all SEMANTIC_CHECKS over one file (path or file object) and return (path, reason) pairs."""
+    tree = etree.parse(xml_path if hasattr(xml_path, "read") else str(xml_path))
+    return walk(tree, [check() for check in SEMANTIC_CHECKS])
@@ -0,0 +1,88 @@
+"""
+Fast JSON validation and model dispatch for LLM outputs.
+
+TypeAdapters are built once per model and validate raw JSON text/bytes
+directly in pydantic-core. The key index maps every field name (or alias) a
+generated model accepts to the models accepting it, so the target model of a
+JSON object can be picked from its top-level keys with a few set operations
+instead of trying each model in turn.
+"""
+from collections import Counter
+from functools import cache
+
+from pydantic import TypeAdapter
+
+from src.model_warmup import iter_models
+
+
+@cache
+def adapter_for(model) -> TypeAdapter:
+    return TypeAdapter(model)
+
+
+def validate_json(raw: str | bytes, model):
+    """Validate raw JSON text against model without a json.loads round trip."""
+    return adapter_for(model).validate_json(raw)
+
+
+def validate_data(data, model):
+    """Validate already-decoded data (e.g. after normalisation) against model."""
+    return adapter_for(model).validate_python(data)
+
+
+class ModelKeyIndex:
+    """
+    Inverted index from accepted top-level keys to models, built once for a
+    module of generated models (nested classes included).
+    """
+
+    def __init__(self, module):
+        self.models = list(iter_models(module))
+        # Ties go to base classes (AeCpuCluster) before subclasses (AeQuadCoreCluster).
+        self.order = {model: i for i, model in
+                      enumerate(sorted(self.models, key=lambda m: (len(m.__mro__), m.__qualname__)))}
+        self.fields = {}
+        self.required = {}
+        self.by_key = {}
+        for model in self.models:
+            keys = {field.alias or name for name, field in model.model_fields.items()}
+            self.fields[model] = frozenset(keys)
+            self.required[model] = frozenset(
+                field.alias or name for name, field in model.model_fields.items() if field.is_required()
+            )
+            for key in keys:
+                self.by_key.setdefault(key, set()).add(model)
+
+    def overlap(self, keys) -> Counter:
+        """Number of the given keys each model accepts."""
+        counts = Counter()
+        for key in keys:
+            counts.update(self.by_key.get(key, ()))
+        return counts
+
+    def rank(self, keys, prefer=(), limit: int | None = None) -> list:
+        """
+        Models accepting at least one of the keys, best fit first: all
+        required fields present, most keys accepted, models in `prefer`
+        (e.g. named in the retrieved context), fewest unused fields.
+        """
+        keys = frozenset(keys)
+        prefer = set(prefer)
+        ranked = sorted(
+            self.overlap(keys).items(),
+            key=lambda item: (not self.required[item[0]] <= keys, -item[1], item[0] not in prefer,
+                              len(self.fields[item[0]]), self.order[item[0]]),
+        )
+        return [model for model, _ in ranked[:limit]]
+
+    def named_in(self, text: str) -> list:
+        """Models whose class name appears in text (case-insensitive)."""
+        text = text.lower()
+        return [model for model in self.models if model.__name__.lower() in text]
+
+
+@cache
+def key_index(module=None) -> ModelKeyIndex:
+    if module is None:
+        from generated_models import ae_xsd_schema as module
+    return ModelKeyIndex(module)
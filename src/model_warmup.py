@@ -0,0 +1,49 @@
+"""
+Eager validator build for the deferred models in generated_models.ae_xsd_schema.
+
+Every generated model sets ConfigDict(defer_build=True), so each class builds
+its pydantic-core validator the first time it is used; the first ArPackage
+validation then stalls while the whole nested graph is built. warm_up()
+moves that cost to a moment of the caller's choosing, e.g. process start or
+just before forking workers, which then inherit the built validators.
+"""
+import inspect
+import time
+from types import ModuleType
+
+from pydantic import BaseModel
+from pydantic_core import SchemaValidator
+
+
+def iter_models(module: ModuleType):
+    """Every model defined in module, nested classes (ArPackage.Elements.Ecus, ...) included."""
+    seen = set()
+    pending = [obj for obj in vars(module).values()
+               if inspect.isclass(obj) and issubclass(obj, BaseModel) and obj.__module__ == module.__name__]
+    while pending:
+        model = pending.pop()
+        if model in seen:
+            continue
+        seen.add(model)
+        yield model
+        pending.extend(obj for obj in vars(model).values()
+                       if inspect.isclass(obj) and issubclass(obj, BaseModel))
+
+
+def warm_up(module: ModuleType | None = None) -> dict:
+    """
+    Build the validators and serializers of every model in module (the
+    generated ae_xsd_schema by default) and report {"models", "seconds"}.
+    Models that are already built are skipped, so calling it again is cheap.
+    """
+    if module is None:
+        from generated_models import ae_xsd_schema as module
+
+    start = time.perf_counter()
+    built = 0
+    for model in iter_models(module):
+        # Deferred models hold a placeholder until their validator is built.
+        if not isinstance(model.__pydantic_validator__, SchemaValidator):
+            model.model_rebuild(force=True)
+            built += 1
+    return {"models": built, "seconds": time.perf_counter() - start}
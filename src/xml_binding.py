@@ -0,0 +1,228 @@
+"""
+Bind AE XML documents straight onto the pydantic models in generated_models.
+
+The field metadata emitted by xsdata ({"name": "SHORT-NAME", "type":
+"Element"/"Attribute"}) is turned once per model class into a binding table
+mapping XML names to fields. Documents are then read with lxml iterparse and
+each model is built bottom-up as soon as its element ends, so no dict copy of
+the document is ever materialised and parsed elements are freed as we go.
+The same tables drive write_xml, which streams models back out as XML.
+
+    from src.xml_binding import parse_ar_package, write_xml
+    package = parse_ar_package("xmls/Ecu_to_Ecu_CANFD_comm.xml")
+    write_xml(package, "roundtrip.xml")
+"""
+import inspect
+import io
+import sys
+import typing
+from enum import Enum
+from functools import cache
+from types import UnionType
+from typing import NamedTuple
+
+from lxml import etree
+from pydantic import BaseModel
+
+
+class FieldBinding(NamedTuple):
+    name: str  # model field name
+    key: str  # keyword the model is constructed with (the alias, if any)
+    xml_name: str
+    many: bool  # list field: repeated elements accumulate
+    model: type[BaseModel] | None  # nested model, None for simple content
+    enum: dict | None  # XML text -> member, for enum-typed fields
+
+
+class ModelBinding(NamedTuple):
+    model: type[BaseModel]
+    xml_name: str
+    elements: dict[str, FieldBinding]
+    attributes: dict[str, FieldBinding]
+
+
+def xml_name_of(model: type[BaseModel]) -> str:
+    meta = getattr(model, "Meta", None)
+    return getattr(meta, "name", model.__name__)
+
+
+def _resolve(annotation, model: type[BaseModel]):
+    # Deferred models may still carry "ArPackage.Elements.Ecus" style forward
+    # references; those are always relative to the generated module.
+    if isinstance(annotation, typing.ForwardRef):
+        annotation = annotation.__forward_arg__
+    if isinstance(annotation, str):
+        annotation = eval(annotation, vars(sys.modules[model.__module__]))
+    return annotation
+
+
+def _unwrap(annotation, model: type[BaseModel]):
+    """Return (inner type, is_list) for X, Optional[X] and list[X] annotations."""
+    many = False
+    while True:
+        annotation = _resolve(annotation, model)
+        origin = typing.get_origin(annotation)
+        if origin in (typing.Union, UnionType):
+            annotation = next(a for a in typing.get_args(annotation) if a is not type(None))
+        elif origin is list:
+            many = True
+            annotation = typing.get_args(annotation)[0]
+        else:
+            return annotation, many
+
+
+@cache
+def binding_for(model: type[BaseModel]) -> ModelBinding:
+    """The XML name tables of one model class, built on first use and cached."""
+    elements, attributes = {}, {}
+    for name, field in model.model_fields.items():
+        metadata = (field.json_schema_extra or {}).get("metadata", {})
+        inner, many = _unwrap(field.annotation, model)
+        # Fields without metadata are attributes named by their alias or field name.
+        xml_name = metadata.get("name", field.alias or name)
+        is_model = inspect.isclass(inner) and issubclass(inner, BaseModel)
+        is_enum = inspect.isclass(inner) and issubclass(inner, Enum)
+        binding = FieldBinding(
+            name=name,
+            key=field.alias or name,
+            xml_name=xml_name,
+            many=many,
+            model=inner if is_model else None,
+            enum={str(member.value): member for member in inner} if is_enum else None,
+        )
+        if metadata.get("type", "Attribute") == "Element":
+            elements[xml_name] = binding
+        else:
+            attributes[xml_name] = binding
+    return ModelBinding(model, xml_name_of(model), elements, attributes)
+
+
+def _attribute_values(binding: ModelBinding, elem) -> dict:
+    values = {}
+    for name, text in elem.attrib.items():
+        field = binding.attributes.get(name)
+        if field is None:
+            if name.startswith("{"):  # xsi:noNamespaceSchemaLocation and friends
+                continue
+            raise ValueError(f"line {elem.sourceline}: unexpected attribute {name!r} "
+                             f"on <{elem.tag}> ({binding.model.__name__})")
+        values[field.key] = field.enum.get(text, text) if field.enum else text
+    return values
+
+
+def _add(values: dict, field: FieldBinding, value):
+    if field.many:
+        values.setdefault(field.key, []).append(value)
+    else:
+        values[field.key] = value
+
+
+def bind(source, model: type[BaseModel]):
+    """
+    Parse an XML file (path or file object) into an instance of `model`,
+    whose XML name must match the document root. Raises ValueError for
+    elements or attributes the model does not know and pydantic's
+    ValidationError for values it rejects.
+    """
+    root = binding_for(model)
+    # One frame per open element: (model binding or None for simple content,
+    # constructor keywords, field binding in the parent).
+    stack = []
+    result = None
+    for event, elem in etree.iterparse(str(source) if not hasattr(source, "read") else source,
+                                       events=("start", "end"), remove_comments=True):
+        if event == "start":
+            if not stack:
+                if elem.tag != root.xml_name:
+                    raise ValueError(f"expected a <{root.xml_name}> document, got <{elem.tag}>")
+                stack.append((root, _attribute_values(root, elem), None))
+                continue
+            parent = stack[-1][0]
+            field = parent.elements.get(elem.tag) if parent is not None else None
+            if field is None:
+                owner = parent.model.__name__ if parent is not None else "simple content"
+                raise ValueError(f"line {elem.sourceline}: unexpected element <{elem.tag}> in {owner}")
+            if field.model is None:
+                stack.append((None, None, field))
+            else:
+                child = binding_for(field.model)
+                stack.append((child, _attribute_values(child, elem), field))
+            continue
+
+        binding, values, field = stack.pop()
+        if binding is None:
+            text = elem.text or ""
+            value = field.enum.get(text, text) if field.enum else text
+        else:
+            value = binding.model(**values)
+        if stack:
+            _add(stack[-1][1], field, value)
+        else:
+            result = value
+        # Everything below this element now lives in `value`.
+        elem.clear()
+        while elem.getprevious() is not None:
+            del elem.getparent()[0]
+    return result
+
+
+def parse_ar_package(source):
+    """Parse an AE configuration file into an ArPackage."""
+    from generated_models.ae_xsd_schema import ArPackage
+
+    return bind(source, ArPackage)
+
+
+def _text(value) -> str:
+    if isinstance(value, Enum):
+        value = value.value
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    return str(value)
+
+
+def _write(xf, obj: BaseModel, tag: str, indent: str, depth: int):
+    binding = binding_for(type(obj))
+    attrib = {}
+    for field in binding.attributes.values():
+        value = getattr(obj, field.name)
+        if value is not None:
+            attrib[field.xml_name] = _text(value)
+    children = []
+    for field in binding.elements.values():
+        value = getattr(obj, field.name)
+        if value is not None:
+            children.extend((field, item) for item in (value if field.many else (value,)))
+    if not children:
+        xf.write(etree.Element(tag, attrib))
+        return
+    with xf.element(tag, attrib):
+        for field, item in children:
+            if indent:
+                xf.write("\n" + indent * (depth + 1))
+            if field.model is None:
+                with xf.element(field.xml_name):
+                    xf.write(_text(item))
+            else:
+                _write(xf, item, field.xml_name, indent, depth + 1)
+        if indent:
+            xf.write("\n" + indent * depth)
+
+
+def write_xml(obj: BaseModel, target, tag: str | None = None, indent: str = "  "):
+    """
+    Stream a model as AE XML to a path or a writable file object (a socket's
+    makefile("wb") works too). tag defaults to the model's XML name, so pass
+    e.g. tag="Chiplet" when writing a fragment such as an AeChipletType.
+    Attributes and children follow the field order, which is the XSD order.
+    """
+    with etree.xmlfile(str(target) if not hasattr(target, "write") else target,
+                       encoding="UTF-8") as xf:
+        xf.write_declaration()
+        _write(xf, obj, tag or xml_name_of(type(obj)), indent, 0)
+
+
+def to_xml_bytes(obj: BaseModel, tag: str | None = None, indent: str = "  ") -> bytes:
+    buffer = io.BytesIO()
+    write_xml(obj, buffer, tag, indent)
+    return buffer.getvalue()
@@ -1,4 +1,4 @@
-from src.ae_xsd_schema import ArPackage
+from generated_models.ae_xsd_schema import ArPackage
 from pydantic import ValidationError
 
 example_json = {
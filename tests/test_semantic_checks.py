@@ -0,0 +1,35 @@
+from semantic_checks import semantic_errors
+
+PREBUILT_APPLICATION = """<AR-PACKAGE><ELEMENTS>
+  <SENDER-RECEIVER-INTERFACE><SHORT-NAME name="Interface1"/></SENDER-RECEIVER-INTERFACE>
+  <PRE-BUILT-APPLICATION>
+    <SHORT-NAME name="App"/>
+    <PATH DEST="{path}"/>
+  </PRE-BUILT-APPLICATION>
+  <APPLICATION-SW-COMPONENT-TYPE><PORTS><P-PORT-PROTOTYPE>
+    <PROVIDED-INTERFACE-TREF DEST="{interface}"/>
+  </P-PORT-PROTOTYPE></PORTS></APPLICATION-SW-COMPONENT-TYPE>
+</ELEMENTS></AR-PACKAGE>"""
+
+
+def test_prebuilt_application_path_is_not_a_reference(write_xml):
+    for path in ("/home/user/applications/MyApp_Controller.bin", "&lt;&lt;TEST_OUT_PATH&gt;&gt;/software/app.elf"):
+        doc = write_xml(PREBUILT_APPLICATION.format(path=path, interface="/Interface1"))
+        assert semantic_errors(doc) == []
+
+
+def test_dangling_reference_is_reported(write_xml):
+    doc = write_xml(PREBUILT_APPLICATION.format(path="/opt/app.bin", interface="/Interface2"))
+    assert semantic_errors(doc) == [
+        ("/AR-PACKAGE/ELEMENTS/APPLICATION-SW-COMPONENT-TYPE/PORTS/P-PORT-PROTOTYPE/PROVIDED-INTERFACE-TREF",
+         "DEST '/Interface2' does not resolve to any SHORT-NAME path"),
+    ]
+
+
+def test_budget_overflow_is_reported(write_xml):
+    chiplets = "".join(f'<Chiplet><SHORT-NAME name="C{i}"/></Chiplet>' for i in range(5))
+    doc = write_xml(f'<AR-PACKAGE><ELEMENTS><ECUs><SoCs><SHORT-NAME name="S"/>{chiplets}'
+                    '</SoCs></ECUs></ELEMENTS></AR-PACKAGE>')
+    assert semantic_errors(doc) == [
+        ("/AR-PACKAGE/ELEMENTS/ECUs/SoCs", "5 CPU_Cluster/Chiplets in this SoC, at most 4 allowed"),
+    ]
@@ -0,0 +1,83 @@
+import functools
+import shutil
+
+import pytest
+
+import validate_xml
+from conftest import ROOT
+
+INVALID = ROOT / "xmls" / "CAN_2_ECUs_with_chiplet.xml"
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    """Keep the schema and result caches of a test in tmp_path."""
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setattr(validate_xml, "CACHE_DIR", cache_dir)
+    monkeypatch.setattr(validate_xml, "ResultCache",
+                        functools.partial(validate_xml.ResultCache, path=cache_dir / "results.json"))
+    return cache_dir
+
+
+def run_incremental(xml_file, schema_path, **options):
+    return list(validate_xml.validate_incremental([xml_file], schema_path, **options))
+
+
+def test_incremental_replays_unchanged_files(cache_dir, tmp_path):
+    schema = shutil.copy(validate_xml.DEFAULT_SCHEMA, tmp_path / "schema.xsd")
+    [(_, errors, timing, _)] = run_incremental(INVALID, schema)
+    assert errors and timing is not None
+    [(_, replayed, timing, _)] = run_incremental(INVALID, schema)
+    assert replayed == errors and timing is None
+
+
+def test_incremental_revalidates_after_schema_change(cache_dir, tmp_path):
+    schema = shutil.copy(validate_xml.DEFAULT_SCHEMA, tmp_path / "schema.xsd")
+    run_incremental(INVALID, schema)
+    with open(schema, "a", encoding="utf-8") as f:
+        f.write("<!-- changed -->\n")
+    [(_, errors, timing, _)] = run_incremental(INVALID, schema)
+    assert errors and timing is not None
+
+
+def test_incremental_keeps_stream_results_apart(cache_dir, tmp_path):
+    schema = shutil.copy(validate_xml.DEFAULT_SCHEMA, tmp_path / "schema.xsd")
+    run_incremental(INVALID, schema, stream=True)
+    [(_, _, timing, _)] = run_incremental(INVALID, schema)
+    assert timing is not None
+
+
+EXACTLY_FIVE = ROOT / "xmls" / "oneHWIP_to_many_chiplets.xml"  # exactly 5 xmlschema errors
+
+
+@pytest.mark.parametrize("engine", sorted(validate_xml.ENGINES))
+def test_max_errors_truncates(engine):
+    errors, _, truncated = validate_xml.ENGINES[engine](validate_xml.DEFAULT_SCHEMA).timed_errors(
+        INVALID, max_errors=3)
+    assert len(errors) == 3 and truncated
+
+
+@pytest.mark.parametrize("engine", sorted(validate_xml.ENGINES))
+def test_exactly_max_errors_is_not_truncated(engine):
+    validator = validate_xml.ENGINES[engine](validate_xml.DEFAULT_SCHEMA)
+    all_errors, _, _ = validator.timed_errors(EXACTLY_FIVE)
+    errors, _, truncated = validator.timed_errors(EXACTLY_FIVE, max_errors=len(all_errors))
+    assert errors == all_errors and not truncated
+
+
+def test_incremental_stores_exactly_max_errors(cache_dir, tmp_path):
+    schema = shutil.copy(validate_xml.DEFAULT_SCHEMA, tmp_path / "schema.xsd")
+    [(_, errors, _, truncated)] = run_incremental(EXACTLY_FIVE, schema, max_errors=5)
+    assert len(errors) == 5 and not truncated
+    [(_, replayed, timing, _)] = run_incremental(EXACTLY_FIVE, schema, max_errors=5)
+    assert replayed == errors and timing is None
+    [(_, replayed, _, truncated)] = run_incremental(EXACTLY_FIVE, schema, max_errors=4)
+    assert len(replayed) == 4 and truncated
+
+
+def test_jsonl_truncated_comes_from_the_engine():
+    from validate_report import file_record
+
+    errors = [("/AR-PACKAGE", "error")] * 5
+    assert file_record(EXACTLY_FIVE, errors, None)["truncated"] is False
+    assert file_record(EXACTLY_FIVE, errors, None, truncated=True)["truncated"] is True
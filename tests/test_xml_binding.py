@@ -0,0 +1,45 @@
+import io
+from pathlib import Path
+
+import pytest
+
+from conftest import ROOT
+from src.xml_binding import parse_ar_package, to_xml_bytes
+from validate_xml import DEFAULT_SCHEMA, collect_errors, load_schema
+
+SCHEMA = load_schema(DEFAULT_SCHEMA, use_cache=False)
+
+
+def schema_valid(xml_file: Path) -> bool:
+    try:
+        return not collect_errors(SCHEMA, xml_file)
+    except Exception:  # malformed files are covered by the validator, not the binding
+        return False
+
+
+VALID_FILES = [f for f in sorted((ROOT / "xmls").glob("*.xml")) + sorted((ROOT / "samples").glob("*.xml"))
+               if schema_valid(f)]
+
+
+def test_corpus_has_valid_files():
+    assert len(VALID_FILES) >= 20
+
+
+@pytest.mark.parametrize("xml_file", VALID_FILES, ids=lambda f: f.name)
+def test_round_trip(xml_file):
+    package = parse_ar_package(xml_file)
+    written = to_xml_bytes(package)
+    assert collect_errors(SCHEMA, io.BytesIO(written)) == []
+    assert parse_ar_package(io.BytesIO(written)) == package
+
+
+def test_unknown_element_is_rejected(write_xml):
+    text = VALID_FILES[0].read_text(encoding="utf-8").replace("<ELEMENTS>", "<ELEMENTS><BOGUS/>", 1)
+    with pytest.raises(ValueError, match="unexpected element <BOGUS>"):
+        parse_ar_package(write_xml(text))
+
+
+def test_unknown_attribute_is_rejected(write_xml):
+    text = VALID_FILES[0].read_text(encoding="utf-8").replace("<ELEMENTS>", '<ELEMENTS bogus="1">', 1)
+    with pytest.raises(ValueError, match="unexpected attribute 'bogus'"):
+        parse_ar_package(write_xml(text))
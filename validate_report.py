@@ -0,0 +1,104 @@
+import json
+import time
+import xml.etree.ElementTree as ET
+from pathlib import Path
+
+
+def print_report(xml_path: Path, errors, truncated: bool = False, out=None):
+    print(f"\n--- Validating: {xml_path} ---", file=out)
+    if not errors:
+        print(" OK: Schema-valid ", file=out)
+    elif truncated:
+        print(f" INVALID: Stopped after the first {len(errors)} errors", file=out)
+    else:
+        print(f" INVALID: Found {len(errors)} errors", file=out)
+    for i, (path, reason) in enumerate(errors, 1):
+        print(f"[{i}] Path={path} Reason={reason}", file=out)
+
+
+def file_record(xml_path: Path, errors, timing: dict | None, truncated: bool = False) -> dict:
+    """
+    Common per-file record used by the machine-readable reporters.
+    timing is None when the result was replayed from the --incremental cache;
+    truncated is the engine's flag for errors beyond --max-errors.
+    """
+    return {
+        "file": str(xml_path),
+        "status": "invalid" if errors else "valid",
+        "truncated": truncated,
+        "cached": timing is None,
+        "errors": [{"path": path, "reason": reason} for path, reason in errors],
+        "timing": dict(timing or {}),
+    }
+
+
+class TextReporter:
+    """The original human-readable Path=... Reason=... output."""
+
+    def __init__(self, out):
+        self.out = out
+
+    def report(self, xml_path: Path, errors, timing: dict | None, truncated: bool = False):
+        print_report(xml_path, errors, truncated, self.out)
+
+    def close(self):
+        pass
+
+
+class JsonLinesReporter(TextReporter):
+    """One JSON object per file, written as soon as the file is done."""
+
+    def report(self, xml_path: Path, errors, timing: dict | None, truncated: bool = False):
+        start = time.perf_counter()
+        record = file_record(xml_path, errors, timing, truncated)
+        record["timing"]["report"] = time.perf_counter() - start
+        self.out.write(json.dumps(record) + "\n")
+        self.out.flush()
+
+
+class JUnitReporter(TextReporter):
+    """
+    A JUnit XML <testsuite> with one <testcase> per file. Each error becomes
+    a line of the <failure> text and the phase timings are testcase
+    <properties>. The document is written on close().
+    """
+
+    def __init__(self, out):
+        super().__init__(out)
+        self.suite = ET.Element("testsuite", name="AE XML schema validation")
+        self.failures = 0
+        self.total_time = 0.0
+
+    def report(self, xml_path: Path, errors, timing: dict | None, truncated: bool = False):
+        start = time.perf_counter()
+        record = file_record(xml_path, errors, timing, truncated)
+        elapsed = sum(record["timing"].values())
+        case = ET.SubElement(self.suite, "testcase", classname=Path(xml_path).parent.name or ".",
+                             name=Path(xml_path).name, file=str(xml_path), time=f"{elapsed:.6f}")
+        properties = ET.SubElement(case, "properties")
+        ET.SubElement(properties, "property", name="cached", value=str(record["cached"]).lower())
+        ET.SubElement(properties, "property", name="truncated", value=str(record["truncated"]).lower())
+        for phase, seconds in record["timing"].items():
+            ET.SubElement(properties, "property", name=f"{phase}_time", value=f"{seconds:.6f}")
+        if errors:
+            self.failures += 1
+            failure = ET.SubElement(case, "failure", message=f"{'first ' if truncated else ''}{len(errors)} schema errors")
+            failure.text = "\n".join(f"Path={e['path']} Reason={e['reason']}" for e in record["errors"])
+        ET.SubElement(properties, "property", name="report_time", value=f"{time.perf_counter() - start:.6f}")
+        self.total_time += elapsed
+
+    def close(self):
+        self.suite.set("tests", str(len(self.suite)))
+        self.suite.set("failures", str(self.failures))
+        self.suite.set("errors", "0")
+        self.suite.set("time", f"{self.total_time:.6f}")
+        ET.indent(self.suite)
+        self.out.write(ET.tostring(self.suite, encoding="unicode", xml_declaration=True) + "\n")
+        self.out.flush()
+
+
+REPORTERS = {
+    "text": TextReporter,
+    "jsonl": JsonLinesReporter,
+    "junit": JUnitReporter,
+}
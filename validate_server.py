@@ -0,0 +1,123 @@
+import io
+import json
+import os
+import signal
+import socketserver
+import sys
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import xmlschema
+from lxml import etree
+
+from validate_xml import ENGINES, check_file
+
+
+def error_records(errors):
+    return [{"path": path, "reason": reason} for path, reason in errors]
+
+
+class ValidationHandler(BaseHTTPRequestHandler):
+    """
+    POST /validate with either
+      - an XML document as the request body, or
+      - a JSON body {"path": "<xml file>"} (Content-Type: application/json)
+    and get back {"valid": bool, "truncated": bool, "errors": [{"path": ..., "reason": ...}]},
+    where truncated means more errors followed the first max_errors.
+    GET /health reports whether the server is up. Documents are checked
+    with the engine, semantic checks and error limit given to make_server.
+    """
+
+    validator = None  # set by make_server
+    options = {}
+
+    def _send_json(self, status: int, payload: dict):
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        if self.path == "/health":
+            self._send_json(200, {"status": "ok"})
+        else:
+            self._send_json(404, {"error": f"unknown endpoint {self.path}"})
+
+    def do_POST(self):
+        if self.path != "/validate":
+            self._send_json(404, {"error": f"unknown endpoint {self.path}"})
+            return
+
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        result = {}
+        truncated = False
+        if self.headers.get("Content-Type", "").startswith("application/json"):
+            try:
+                source = Path(json.loads(body)["path"])
+            except (ValueError, KeyError, TypeError):
+                self._send_json(400, {"error": 'expected a JSON body {"path": "<xml file>"}'})
+                return
+            if not source.is_file():
+                self._send_json(404, {"error": f"no such file: {source}"})
+                return
+            result["file"] = str(source)
+        else:
+            source = io.BytesIO(body)
+
+        try:
+            errors, _, truncated = check_file(self.validator, source, **self.options)
+        except xmlschema.XMLResourceError as e:
+            errors = [(None, str(e))]
+        except etree.XMLSyntaxError as e:
+            errors = [(None, f"invalid XML syntax: {e}")]
+        result.update(valid=not errors, truncated=truncated, errors=error_records(errors))
+        self._send_json(200, result)
+
+
+class UnixValidationHandler(ValidationHandler):
+    def address_string(self):
+        return "unix"
+
+
+class ThreadingUnixHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+    def server_bind(self):
+        socketserver.UnixStreamServer.server_bind(self)
+        self.server_name, self.server_port = "localhost", 0
+
+
+def make_server(schema_path: Path, host: str = "127.0.0.1", port: int = 8765,
+                socket_path: Path | None = None, use_cache: bool = True, engine: str = "xmlschema",
+                **options):
+    """
+    Load one of the ENGINES once and bind an HTTP server on localhost or a
+    Unix socket. Extra keyword options (semantic, max_errors, stream) are
+    passed through to check_file for every request.
+    """
+    attrs = {"validator": ENGINES[engine](schema_path, use_cache), "options": options}
+    if socket_path is not None:
+        if os.path.exists(socket_path):
+            os.remove(socket_path)
+        handler = type("Handler", (UnixValidationHandler,), attrs)
+        return ThreadingUnixHTTPServer(str(socket_path), handler)
+    handler = type("Handler", (ValidationHandler,), attrs)
+    return ThreadingHTTPServer((host, port), handler)
+
+
+def serve(schema_path: Path, host: str = "127.0.0.1", port: int = 8765,
+          socket_path: Path | None = None, use_cache: bool = True, **options):
+    server = make_server(schema_path, host, port, socket_path, use_cache, **options)
+    where = socket_path if socket_path is not None else f"http://{host}:{server.server_port}"
+    print(f"Serving validation on {where} (POST /validate)")
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        if socket_path is not None and os.path.exists(socket_path):
+            os.remove(socket_path)
@@ -0,0 +1,157 @@
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import time
+from pathlib import Path
+
+import xmlschema
+from lxml import etree
+
+from validate_xml import ENGINES, check_file
+
+# inotify(7) constants
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_NONBLOCK = os.O_NONBLOCK
+IN_CLOEXEC = 0o2000000
+EVENT_HEADER = struct.Struct("iIII")  # wd, mask, cookie, len
+
+WATCH_MASK = IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE
+
+
+class InotifyWatcher:
+    """Changed *.xml files in a set of directories, via Linux inotify."""
+
+    def __init__(self, directories):
+        libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        self._fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self._dirs = {}
+        for directory in directories:
+            wd = libc.inotify_add_watch(self._fd, os.fsencode(directory), WATCH_MASK)
+            if wd < 0:
+                os.close(self._fd)
+                raise OSError(ctypes.get_errno(), f"inotify_add_watch failed for {directory}")
+            self._dirs[wd] = Path(directory)
+
+    def poll(self, timeout: float):
+        """Wait up to timeout seconds and return the set of changed files."""
+        changed = set()
+        ready, _, _ = select.select([self._fd], [], [], timeout)
+        if not ready:
+            return changed
+        while True:
+            try:
+                data = os.read(self._fd, 64 * 1024)
+            except BlockingIOError:
+                return changed
+            offset = 0
+            while offset < len(data):
+                wd, _mask, _cookie, length = EVENT_HEADER.unpack_from(data, offset)
+                offset += EVENT_HEADER.size
+                name = data[offset:offset + length].rstrip(b"\0").decode(errors="replace")
+                offset += length
+                if name.endswith(".xml") and wd in self._dirs:
+                    changed.add(self._dirs[wd] / name)
+
+    def close(self):
+        os.close(self._fd)
+
+
+class PollingWatcher:
+    """Fallback watcher comparing (mtime, size) of *.xml files on each poll."""
+
+    def __init__(self, directories):
+        self._dirs = [Path(d) for d in directories]
+        self._seen = self._scan()
+
+    def _scan(self):
+        stamps = {}
+        for directory in self._dirs:
+            for xml_file in directory.glob("*.xml"):
+                try:
+                    st = xml_file.stat()
+                except OSError:
+                    continue
+                stamps[xml_file] = (st.st_mtime_ns, st.st_size)
+        return stamps
+
+    def poll(self, timeout: float):
+        time.sleep(timeout)
+        current = self._scan()
+        changed = {f for f, stamp in current.items() if self._seen.get(f) != stamp}
+        self._seen = current
+        return changed
+
+    def close(self):
+        pass
+
+
+def make_watcher(directories, polling: bool = False):
+    if not polling and sys.platform.startswith("linux"):
+        try:
+            return InotifyWatcher(directories)
+        except (OSError, AttributeError) as e:
+            print(f"inotify unavailable ({e}), falling back to polling", file=sys.stderr)
+    return PollingWatcher(directories)
+
+
+def safe_timed_errors(validator, xml_path: Path, **options):
+    """Like check_file, but half-saved files report a syntax error instead of raising."""
+    try:
+        return check_file(validator, xml_path, **options)
+    except xmlschema.XMLResourceError as e:
+        # xmlschema's message already starts with "invalid XML syntax: ..."
+        return [(None, str(e))], {"parse": 0.0, "validate": 0.0}, False
+    except etree.XMLSyntaxError as e:
+        return [(None, f"invalid XML syntax: {e}")], {"parse": 0.0, "validate": 0.0}, False
+
+
+def watch(targets, schema_path: Path, reporter, use_cache: bool = True, engine: str = "xmlschema",
+          debounce: float = 0.3, poll_interval: float = 1.0, polling: bool = False, **options):
+    """
+    Validate every *.xml file under targets once, then keep the schema loaded
+    and revalidate only the files that change. Bursts of saves are collapsed:
+    files are validated once no new change has arrived for `debounce` seconds.
+    A target may be a folder or a single file (its folder is watched and other
+    files are ignored).
+    """
+    folders, files = set(), set()
+    for target in map(Path, targets):
+        if target.is_dir():
+            folders.add(target)
+        else:
+            files.add(target)
+    directories = folders | {f.parent for f in files}
+
+    def wanted(xml_file: Path) -> bool:
+        return xml_file.parent in folders or xml_file in files
+
+    validator = ENGINES[engine](schema_path, use_cache)
+    initial = sorted({f for d in folders for f in d.glob("*.xml")} | {f for f in files if f.is_file()})
+    for xml_file in initial:
+        reporter.report(xml_file, *safe_timed_errors(validator, xml_file, **options))
+
+    watcher = make_watcher(directories, polling)
+    print(f"\nWatching {', '.join(str(d) for d in sorted(directories))} for changes (Ctrl-C to stop)",
+          file=sys.stderr)
+    pending = set()
+    try:
+        while True:
+            changed = watcher.poll(debounce if pending else poll_interval)
+            if changed:
+                pending |= {f for f in changed if wanted(f)}
+                continue
+            for xml_file in sorted(pending):
+                if xml_file.is_file():
+                    reporter.report(xml_file, *safe_timed_errors(validator, xml_file, **options))
+            pending.clear()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        watcher.close()
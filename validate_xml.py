@@ -1,35 +1,444 @@
+import argparse
+import hashlib
+import itertools
+import json
+import os
+import pickle
 import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 import xmlschema
+from lxml import etree
 
-def main():
-    if len(sys.argv) < 2:
-        print("Usage: python validate_xml.py <xml-file-or-folder> [schema.xsd]")
-        sys.exit(1)
+from semantic_checks import semantic_errors
+from validate_report import REPORTERS
+
+DEFAULT_SCHEMA = Path(__file__).parent / "AE_XSD_schema.xsd"
+DEFAULT_WATCH = (Path(__file__).parent / "xmls", Path(__file__).parent / "samples")
+CACHE_DIR = Path(os.environ.get("AE_VALIDATOR_CACHE")
+                 or Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "ae_xmlvalidator")
+
+# Depth of the subtrees validated one at a time in streaming mode:
+# AR-PACKAGE (0) / ELEMENTS (1) / SENDER-RECEIVER-INTERFACE, ECUs, ... (2)
+STREAM_DEPTH = 2
+
+# Errors collected per file with --fail-fast when --max-errors is not given.
+FAIL_FAST_MAX_ERRORS = 10
+
+# Engine and timed_errors options loaded once per pool worker by _init_worker.
+_worker_engine = None
+_worker_options = {}
+
+
+def schema_digest(schema_path: Path) -> str:
+    """Hash of the XSD content and the xmlschema/Python versions that build it."""
+    h = hashlib.sha256(Path(schema_path).read_bytes())
+    h.update(f"xmlschema-{xmlschema.__version__}/py{sys.version_info[0]}.{sys.version_info[1]}".encode())
+    return h.hexdigest()
+
+
+def load_schema(schema_path: Path, use_cache: bool = True):
+    """
+    Build the XMLSchema, reusing a pickled copy from CACHE_DIR when the XSD
+    content and xmlschema version are unchanged. A stale or unreadable cache
+    entry is simply rebuilt.
+    """
+    if not use_cache:
+        return xmlschema.XMLSchema(schema_path)
 
-    target = Path(sys.argv[1])
-    schema_path = Path(sys.argv[2]) if len(sys.argv) > 2 else Path(__file__).parent / "AE_XSD_schema.xsd"
+    cache_file = CACHE_DIR / f"schema-{schema_digest(schema_path)}.pickle"
+    try:
+        with open(cache_file, "rb") as f:
+            return pickle.load(f)
+    except Exception:
+        pass
 
-    print(f"Loading schema: {schema_path}")
     schema = xmlschema.XMLSchema(schema_path)
+    tmp = None
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=CACHE_DIR, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump(schema, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, cache_file)
+    except Exception as e:
+        print(f"Warning: could not write schema cache: {e}", file=sys.stderr)
+        if tmp and os.path.exists(tmp):
+            os.remove(tmp)
+    return schema
 
-    def validate_one(xml_path: Path):
-        print(f"\n--- Validating: {xml_path} ---")
-        errors = list(schema.iter_errors(xml_path))
 
-        if not errors:
-            print(" OK: Schema-valid ")
-        else:
-            print(f" INVALID: Found {len(errors)} errors")
-            for i, err in enumerate(errors, 1):
-                print(f"[{i}] Path={err.path} Reason={err.reason}")
+def first_errors(errors, max_errors: int | None = None):
+    """
+    The first max_errors (path, reason) pairs of an error iterable, and
+    whether it had more. One extra error is read to tell a file with exactly
+    max_errors errors from one that was cut short.
+    """
+    if max_errors is None:
+        return list(errors), False
+    errors = list(itertools.islice(errors, max_errors + 1))
+    return errors[:max_errors], len(errors) > max_errors
 
 
-    if target.is_dir():
-        for xml_file in sorted(target.glob("*.xml")):
-            validate_one(xml_file)
+def timed_errors(schema, xml_path: Path, stream: bool = False, max_errors: int | None = None):
+    """
+    Validate one file and return (errors, timing, truncated), where errors
+    are picklable (path, reason) pairs, timing holds the parse and validate
+    seconds and truncated tells whether iteration stopped after max_errors
+    errors with more to come.
+
+    With stream=True the document is read as a thin lazy resource: each
+    ELEMENTS child is validated and then released, so peak memory does not
+    grow with the document size. Parsing then happens during validation and
+    is counted there. Error reasons are the same as in a full validation,
+    but content-model errors may be reported at the path of an element deep
+    inside the subtree concerned (e.g. .../Chiplet[1]/.../REQUIRED-PORT-TREF
+    instead of .../Chiplet[1]).
+    """
+    start = time.perf_counter()
+    if stream:
+        source = xmlschema.XMLResource(xml_path, lazy=STREAM_DEPTH, thin_lazy=True)
     else:
-        validate_one(target)
+        source = xmlschema.XMLResource(xml_path)
+    parsed = time.perf_counter()
+    errors, truncated = first_errors(((err.path, err.reason) for err in schema.iter_errors(source)), max_errors)
+    timing = {"parse": parsed - start, "validate": time.perf_counter() - parsed}
+    return errors, timing, truncated
+
+
+def parse_source(xml_path):
+    """lxml.etree.parse for a path or a file object such as a request body."""
+    return etree.parse(xml_path if hasattr(xml_path, "read") else str(xml_path))
+
+
+def rewind(xml_path):
+    """Rewind a file-object source before another pass over it; paths are left alone."""
+    if hasattr(xml_path, "seek"):
+        xml_path.seek(0)
+
+
+def collect_errors(schema, xml_path: Path, **options):
+    """Return the validation errors of one file as picklable (path, reason) pairs."""
+    return timed_errors(schema, xml_path, **options)[0]
+
+
+class XmlschemaEngine:
+    """Pure-Python xmlschema validation, the reference engine."""
+
+    def __init__(self, schema_path: Path, use_cache: bool = True):
+        self.schema = load_schema(schema_path, use_cache)
+
+    def timed_errors(self, xml_path: Path, **options):
+        return timed_errors(self.schema, xml_path, **options)
+
+
+class LxmlEngine:
+    """
+    libxml2 validation through lxml.etree.XMLSchema. Much faster than
+    xmlschema, but error reasons are libxml2's messages and the whole
+    document is loaded (no stream support). The error log belongs to the
+    schema object, so validations are serialized for --serve's threads.
+    """
+
+    def __init__(self, schema_path: Path, use_cache: bool = True):
+        self.schema = etree.XMLSchema(etree.parse(str(schema_path)))
+        self.lock = threading.Lock()
+
+    def timed_errors(self, xml_path: Path, stream: bool = False, max_errors: int | None = None):
+        start = time.perf_counter()
+        doc = parse_source(xml_path)
+        parsed = time.perf_counter()
+        with self.lock:
+            self.schema.validate(doc)
+            errors, truncated = first_errors(((e.path, e.message) for e in self.schema.error_log), max_errors)
+        timing = {"parse": parsed - start, "validate": time.perf_counter() - parsed}
+        return errors, timing, truncated
+
+
+class AutoEngine:
+    """
+    A quick lxml pass on every file; files lxml rejects (or cannot parse)
+    are validated again with xmlschema so their report keeps xmlschema's
+    error paths and reasons. The xmlschema schema is only loaded once a
+    file needs it.
+    """
+
+    def __init__(self, schema_path: Path, use_cache: bool = True):
+        self.fast = LxmlEngine(schema_path)
+        self.schema_path = schema_path
+        self.use_cache = use_cache
+        self.full = None
+
+    def timed_errors(self, xml_path: Path, **options):
+        try:
+            errors, timing, _ = self.fast.timed_errors(xml_path)
+            if not errors:
+                return errors, timing, False
+        except etree.XMLSyntaxError:
+            timing = {"parse": 0.0, "validate": 0.0}
+        if self.full is None:
+            self.full = XmlschemaEngine(self.schema_path, self.use_cache)
+        rewind(xml_path)
+        errors, full_timing, truncated = self.full.timed_errors(xml_path, **options)
+        return errors, {phase: timing[phase] + full_timing[phase] for phase in timing}, truncated
+
+
+ENGINES = {
+    "xmlschema": XmlschemaEngine,
+    "lxml": LxmlEngine,
+    "auto": AutoEngine,
+}
+
+
+def check_file(validator, xml_path: Path, semantic: bool = False, **options):
+    """
+    Validate one file with an engine and, with semantic=True, append the
+    findings of the semantic checks (dangling references, ...) to its
+    errors. Returns (errors, timing, truncated).
+    """
+    errors, timing, truncated = validator.timed_errors(xml_path, **options)
+    if semantic:
+        start = time.perf_counter()
+        rewind(xml_path)
+        more, cut = first_errors(errors + semantic_errors(xml_path), options.get("max_errors"))
+        errors, truncated = more, truncated or cut
+        timing["semantic"] = time.perf_counter() - start
+    return errors, timing, truncated
+
+
+def _init_worker(schema_path: Path, use_cache: bool, engine: str, options: dict):
+    global _worker_engine, _worker_options
+    _worker_engine = ENGINES[engine](schema_path, use_cache)
+    _worker_options = options
+
+
+def _validate_in_worker(xml_path: Path):
+    return check_file(_worker_engine, xml_path, **_worker_options)
+
+
+def validate_parallel(xml_files, schema_path: Path, jobs: int, use_cache: bool = True,
+                      engine: str = "xmlschema", **options):
+    """Validate files over a process pool, yielding (file, errors, timing, truncated) in input order."""
+    chunksize = max(1, len(xml_files) // (jobs * 4))
+    pool = ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker,
+                               initargs=(schema_path, use_cache, engine, options))
+    try:
+        for xml_file, result in zip(xml_files, pool.map(_validate_in_worker, xml_files, chunksize=chunksize)):
+            yield (xml_file, *result)
+    finally:
+        # Drop queued files if the caller stops early (e.g. --fail-fast).
+        pool.shutdown(cancel_futures=True)
+
+
+def validate_files(xml_files, schema_path: Path, jobs: int = 1, use_cache: bool = True,
+                   engine: str = "xmlschema", **options):
+    """
+    Yield (file, errors, timing, truncated) for each file in order, in-process or over
+    a pool, using one of the ENGINES. Extra keyword options are passed
+    through to check_file.
+    """
+    if not xml_files:
+        return
+    if jobs > 1 and len(xml_files) > 1:
+        yield from validate_parallel(xml_files, schema_path, min(jobs, len(xml_files)), use_cache,
+                                     engine, **options)
+    else:
+        validator = ENGINES[engine](schema_path, use_cache)
+        for xml_file in xml_files:
+            yield (xml_file, *check_file(validator, xml_file, **options))
+
+
+def file_digest(path: Path) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            h.update(block)
+    return h.hexdigest()
+
+
+class ResultCache:
+    """
+    Validation results keyed on (file digest, schema digest, engine/checks),
+    stored as JSON in CACHE_DIR. Entries for other schema digests are
+    dropped on save.
+    """
+
+    def __init__(self, schema_path: Path, engine: str = "xmlschema", path: Path = CACHE_DIR / "results.json"):
+        self.path = path
+        self.schema_digest = schema_digest(schema_path)
+        self.engine = engine
+        try:
+            self.entries = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            self.entries = {}
+
+    def _key(self, digest: str) -> str:
+        return f"{digest}:{self.schema_digest}:{self.engine}"
+
+    def get(self, digest: str):
+        errors = self.entries.get(self._key(digest))
+        return None if errors is None else [tuple(e) for e in errors]
+
+    def put(self, digest: str, errors):
+        self.entries[self._key(digest)] = [list(e) for e in errors]
+
+    def save(self):
+        current = f":{self.schema_digest}:"
+        entries = {k: v for k, v in self.entries.items() if current in k}
+        tmp = None
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            # A private temp file, so concurrent runs sharing the cache never replace half-written data.
+            fd, tmp = tempfile.mkstemp(dir=self.path.parent, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(entries, f)
+            os.replace(tmp, self.path)
+        except OSError as e:
+            print(f"Warning: could not write result cache: {e}", file=sys.stderr)
+            if tmp and os.path.exists(tmp):
+                os.remove(tmp)
+
+
+def validate_incremental(xml_files, schema_path: Path, jobs: int = 1, use_cache: bool = True, **options):
+    """
+    Replay stored results for files whose content and schema are unchanged,
+    and validate only the rest. Yields (file, errors, timing, truncated) in
+    input order; timing is None for replayed results. Error lists truncated
+    by max_errors are not stored.
+    """
+    # Stream mode reports some errors at other paths, so its results are kept apart.
+    mode = (options.get("engine", "xmlschema") + ("+stream" if options.get("stream") else "")
+            + ("+semantic" if options.get("semantic") else ""))
+    cache = ResultCache(schema_path, mode)
+    max_errors = options.get("max_errors")
+    digests = {xml_file: file_digest(xml_file) for xml_file in xml_files}
+    known = {f: cache.get(d) for f, d in digests.items()}
+    changed = [f for f in xml_files if known[f] is None]
+    print(f"Incremental: {len(xml_files) - len(changed)} unchanged, {len(changed)} to validate",
+          file=sys.stderr)
+
+    fresh = validate_files(changed, schema_path, jobs, use_cache, **options)
+    try:
+        for xml_file in xml_files:
+            errors, timing = known[xml_file], None
+            if errors is None:
+                _, errors, timing, truncated = next(fresh)
+                if not truncated:
+                    cache.put(digests[xml_file], errors)
+            else:
+                errors, truncated = first_errors(errors, max_errors)
+            yield xml_file, errors, timing, truncated
+    finally:
+        fresh.close()
+        cache.save()
+
+
+def non_negative_int(value: str) -> int:
+    number = int(value)
+    if number < 0:
+        raise argparse.ArgumentTypeError(f"must be at least 0, got {value}")
+    return number
+
+
+def positive_int(value: str) -> int:
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {value}")
+    return number
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Validate AE XML files against the AE XSD schema.")
+    parser.add_argument("target", type=Path, nargs="?", help="XML file or folder of XML files")
+    parser.add_argument("schema", type=Path, nargs="?", default=DEFAULT_SCHEMA, help="XSD schema (default: AE_XSD_schema.xsd)")
+    parser.add_argument("-j", "--jobs", type=non_negative_int, default=1,
+                        help="number of worker processes for folder validation (0 = one per CPU)")
+    parser.add_argument("--no-schema-cache", dest="schema_cache", action="store_false",
+                        help=f"always rebuild the schema instead of using the cache in {CACHE_DIR}")
+    parser.add_argument("--incremental", action="store_true",
+                        help="reuse stored results for files unchanged since the last run")
+    parser.add_argument("--stream", action="store_true",
+                        help="validate ELEMENTS children one subtree at a time to keep memory flat on huge files")
+    parser.add_argument("--engine", choices=sorted(ENGINES), default="xmlschema",
+                        help="xmlschema (reference), lxml (fast, libxml2 messages) or auto "
+                             "(lxml first, xmlschema re-run on failing files); default: xmlschema")
+    parser.add_argument("--semantic", action="store_true",
+                        help="also run the semantic checks: DEST/*Ref references must resolve to a "
+                             "SHORT-NAME path, and SoC/Chiplet/Generic_Hardware budgets must hold")
+    parser.add_argument("--max-errors", type=positive_int, metavar="N",
+                        help="stop validating a file after its first N errors (N >= 1)")
+    parser.add_argument("--fail-fast", action="store_true",
+                        help="stop at the first invalid file and exit with status 1; "
+                             f"implies --max-errors {FAIL_FAST_MAX_ERRORS} unless it is given")
+    parser.add_argument("--format", choices=sorted(REPORTERS), default="text",
+                        help="report format: human-readable text, JSON Lines or JUnit XML (default: text)")
+    parser.add_argument("-o", "--output", type=Path, help="write the report to this file instead of stdout")
+    parser.add_argument("--watch", action="store_true",
+                        help="keep running and revalidate files as they change "
+                             "(default target: xmls/ and samples/)")
+    parser.add_argument("--poll", action="store_true",
+                        help="with --watch, poll for changes instead of using inotify")
+    parser.add_argument("--serve", action="store_true",
+                        help="keep the schema loaded and answer validation requests over HTTP")
+    parser.add_argument("--port", type=int, default=8765, help="localhost port for --serve (default: 8765)")
+    parser.add_argument("--socket", type=Path, help="serve on this Unix socket instead of a TCP port")
+    args = parser.parse_args()
+
+    if args.target is None and not (args.serve or args.watch):
+        parser.error("a target XML file or folder is required unless --serve or --watch is given")
+    if args.stream and args.engine != "xmlschema":
+        parser.error("--stream is only supported with --engine xmlschema")
+    if args.stream and args.semantic:
+        parser.error("--stream cannot be combined with --semantic, which loads the whole document")
+
+    if args.fail_fast and args.max_errors is None:
+        args.max_errors = FAIL_FAST_MAX_ERRORS
+    options = dict(engine=args.engine, stream=args.stream, max_errors=args.max_errors, semantic=args.semantic)
+
+    if args.serve:
+        from validate_server import serve
+        serve(args.schema, port=args.port, socket_path=args.socket, use_cache=args.schema_cache, **options)
+        return
+
+    target = args.target
+    schema_path = args.schema
+    jobs = args.jobs or os.cpu_count() or 1
+
+    out = open(args.output, "w", encoding="utf-8") if args.output else sys.stdout
+    reporter = REPORTERS[args.format](out)
+
+    print(f"Loading schema: {schema_path}", file=sys.stdout if args.format == "text" else sys.stderr)
+    if args.watch:
+        from validate_watch import watch
+        try:
+            watch([target] if target else DEFAULT_WATCH, schema_path, reporter, args.schema_cache,
+                  polling=args.poll, **options)
+        finally:
+            reporter.close()
+            if out is not sys.stdout:
+                out.close()
+        return
+
+    xml_files = sorted(target.glob("*.xml")) if target.is_dir() else [target]
+    if args.incremental:
+        results = validate_incremental(xml_files, schema_path, jobs, args.schema_cache, **options)
+    else:
+        results = validate_files(xml_files, schema_path, jobs, args.schema_cache, **options)
+
+    try:
+        for xml_file, errors, timing, truncated in results:
+            reporter.report(xml_file, errors, timing, truncated)
+            if errors and args.fail_fast:
+                results.close()
+                print(f"\nStopping at first invalid file: {xml_file}", file=sys.stderr)
+                sys.exit(1)
+    finally:
+        reporter.close()
+        if out is not sys.stdout:
+            out.close()
 
 if __name__ == "__main__":
     main()